@@ -213,6 +213,9 @@ SCORING_CRITERIA = {
     }
 }
 
+# Maximum total score, summed once rather than wherever it's needed
+TOTAL_WEIGHT = sum(c["weight"] for c in SCORING_CRITERIA.values())
+
 
 def score_output(output: str, task: BenchmarkTask) -> Tuple[Dict[str, int], int]:
     """
@@ -303,7 +306,7 @@ def score_output_manual(output: str, task: BenchmarkTask) -> Tuple[Dict[str, int
                 print("Enter a number")
     
     total = sum(scores.values())
-    print(f"\nTotal score: {total}/100")
+    print(f"\nTotal score: {total}/{TOTAL_WEIGHT}")
     return scores, total
 
 
@@ -25,6 +25,7 @@ import hashlib
 from dataclasses import dataclass, field
 from typing import Dict, List, Optional, Tuple, Set, Any
 from enum import Enum
+from functools import lru_cache
 import textwrap
 
 
@@ -60,7 +61,7 @@ class CodeBlock:
         return hashlib.md5(normalized.encode()).hexdigest()[:8]
 
 
-@dataclass
+@dataclass(slots=True)
 class CodeComponent:
     """A parsed component (function, class, import, etc.)."""
     type: ComponentType
@@ -154,8 +155,15 @@ class CodeBlockParser:
             List of CodeBlock objects
         """
         blocks = []
+        # Line numbers are counted incrementally from the previous match
+        # instead of re-slicing the output from the top for every block.
+        line, pos = 1, 0
         
         for match in self.CODE_BLOCK_PATTERN.finditer(output):
+            start, end = match.span()
+            start_line = line + output.count('\n', pos, start)
+            line, pos = start_line + output.count('\n', start, end), end
+            
             language = match.group(1).lower() or "text"
             language = self.LANGUAGE_ALIASES.get(language, language)
             content = match.group(2).strip()
@@ -165,8 +173,8 @@ class CodeBlockParser:
                     content=content,
                     language=language,
                     source_model=source_model,
-                    start_line=output[:match.start()].count('\n') + 1,
-                    end_line=output[:match.end()].count('\n') + 1
+                    start_line=start_line,
+                    end_line=line
                 ))
         
         # If no code blocks found, treat entire output as code
@@ -192,6 +200,25 @@ class CodeBlockParser:
         return unique
 
 
+# =============================================================================
+# SHARED PARSE
+# =============================================================================
+
+@lru_cache(maxsize=512)
+def parse_python(code: str) -> Tuple[Optional[ast.Module], Optional[SyntaxError]]:
+    """
+    Parse Python source once for every consumer in this module.
+    
+    Returns (tree, None) on success or (None, error) on a syntax error.
+    Results are cached by source, so callers must treat the tree as read-only.
+    """
+    try:
+        return ast.parse(code), None
+    except SyntaxError as e:
+        e.__traceback__ = None
+        return None, e
+
+
 # =============================================================================
 # COMPONENT PARSER (Python AST)
 # =============================================================================
@@ -212,9 +239,8 @@ class PythonComponentParser:
         """
         components = []
         
-        try:
-            tree = ast.parse(code)
-        except SyntaxError:
+        tree, error = parse_python(code)
+        if error is not None:
             # Return as single component if parsing fails
             return [CodeComponent(
                 type=ComponentType.OTHER,
@@ -225,7 +251,7 @@ class PythonComponentParser:
         
         lines = code.split('\n')
         
-        for node in ast.iter_child_nodes(tree):
+        for node in tree.body:
             component = self._node_to_component(node, lines, source_model)
             if component:
                 components.append(component)
@@ -239,73 +265,92 @@ class PythonComponentParser:
         source_model: str
     ) -> Optional[CodeComponent]:
         """Convert AST node to CodeComponent."""
-        
-        if isinstance(node, ast.Import):
-            code = f"import {', '.join(a.name for a in node.names)}"
-            return CodeComponent(
-                type=ComponentType.IMPORT,
-                name=node.names[0].name,
-                code=code,
-                source_model=source_model
-            )
-        
-        elif isinstance(node, ast.ImportFrom):
-            names = ', '.join(a.name for a in node.names)
-            code = f"from {node.module or ''} import {names}"
-            return CodeComponent(
-                type=ComponentType.IMPORT,
-                name=f"{node.module}.{node.names[0].name}",
-                code=code,
-                source_model=source_model
-            )
-        
-        elif isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
-            code = self._get_source(node, lines)
-            deps = self._extract_dependencies(node)
-            return CodeComponent(
-                type=ComponentType.FUNCTION,
-                name=node.name,
-                code=code,
-                source_model=source_model,
-                dependencies=deps,
-                metadata={
-                    "args": [a.arg for a in node.args.args],
-                    "is_async": isinstance(node, ast.AsyncFunctionDef),
-                    "decorators": [self._get_decorator_name(d) for d in node.decorator_list],
-                    "has_docstring": ast.get_docstring(node) is not None
-                }
-            )
-        
-        elif isinstance(node, ast.ClassDef):
-            code = self._get_source(node, lines)
-            deps = self._extract_dependencies(node)
-            return CodeComponent(
-                type=ComponentType.CLASS,
-                name=node.name,
-                code=code,
-                source_model=source_model,
-                dependencies=deps,
-                metadata={
-                    "bases": [self._get_name(b) for b in node.bases],
-                    "methods": [n.name for n in node.body if isinstance(n, (ast.FunctionDef, ast.AsyncFunctionDef))],
-                    "has_docstring": ast.get_docstring(node) is not None
-                }
-            )
-        
-        elif isinstance(node, ast.Assign):
-            # Constants (uppercase names)
-            for target in node.targets:
-                if isinstance(target, ast.Name) and target.id.isupper():
-                    code = self._get_source(node, lines)
-                    return CodeComponent(
-                        type=ComponentType.CONSTANT,
-                        name=target.id,
-                        code=code,
-                        source_model=source_model
-                    )
-        
+        handler = self._HANDLERS.get(type(node))
+        if handler is None:
+            return None
+        return handler(self, node, lines, source_model)
+    
+    def _import_component(self, node: ast.Import, lines: List[str], source_model: str) -> CodeComponent:
+        """Component for an ``import`` statement."""
+        code = f"import {', '.join(a.name for a in node.names)}"
+        return CodeComponent(
+            type=ComponentType.IMPORT,
+            name=node.names[0].name,
+            code=code,
+            source_model=source_model
+        )
+    
+    def _import_from_component(self, node: ast.ImportFrom, lines: List[str], source_model: str) -> CodeComponent:
+        """Component for a ``from ... import`` statement."""
+        names = ', '.join(a.name for a in node.names)
+        code = f"from {node.module or ''} import {names}"
+        return CodeComponent(
+            type=ComponentType.IMPORT,
+            name=f"{node.module}.{node.names[0].name}",
+            code=code,
+            source_model=source_model
+        )
+    
+    def _function_component(self, node: ast.FunctionDef, lines: List[str], source_model: str) -> CodeComponent:
+        """Component for a (possibly async) function definition."""
+        code = self._get_source(node, lines)
+        deps = self._extract_dependencies(node)
+        return CodeComponent(
+            type=ComponentType.FUNCTION,
+            name=node.name,
+            code=code,
+            source_model=source_model,
+            dependencies=deps,
+            metadata={
+                "args": [a.arg for a in node.args.args],
+                "is_async": isinstance(node, ast.AsyncFunctionDef),
+                "decorators": [self._get_decorator_name(d) for d in node.decorator_list],
+                "has_docstring": ast.get_docstring(node) is not None
+            }
+        )
+    
+    def _class_component(self, node: ast.ClassDef, lines: List[str], source_model: str) -> CodeComponent:
+        """Component for a class definition."""
+        code = self._get_source(node, lines)
+        deps = self._extract_dependencies(node)
+        return CodeComponent(
+            type=ComponentType.CLASS,
+            name=node.name,
+            code=code,
+            source_model=source_model,
+            dependencies=deps,
+            metadata={
+                "bases": [self._get_name(b) for b in node.bases],
+                "methods": [n.name for n in node.body if isinstance(n, (ast.FunctionDef, ast.AsyncFunctionDef))],
+                "has_docstring": ast.get_docstring(node) is not None
+            }
+        )
+    
+    def _constant_component(self, node: ast.Assign, lines: List[str], source_model: str) -> Optional[CodeComponent]:
+        """Component for a module-level constant, if any target is uppercase."""
+        # Constants (uppercase names)
+        for target in node.targets:
+            if isinstance(target, ast.Name) and target.id.isupper():
+                code = self._get_source(node, lines)
+                return CodeComponent(
+                    type=ComponentType.CONSTANT,
+                    name=target.id,
+                    code=code,
+                    source_model=source_model
+                )
         return None
     
+    # One dict lookup on the node type instead of an isinstance chain per
+    # top-level statement.
+    _HANDLERS = {
+        ast.Import: _import_component,
+        ast.ImportFrom: _import_from_component,
+        ast.FunctionDef: _function_component,
+        ast.AsyncFunctionDef: _function_component,
+        ast.ClassDef: _class_component,
+        ast.Assign: _constant_component,
+    }
+    
     def _get_source(self, node: ast.AST, lines: List[str]) -> str:
         """Extract source code for an AST node."""
         if hasattr(node, 'lineno') and hasattr(node, 'end_lineno'):
@@ -359,6 +404,11 @@ class QualityScorer:
         "testing": 10         # Error handling, test hints
     }
     
+    # Heuristic patterns
+    RANGE_LEN_PATTERN = re.compile(r'for.*in.*range.*len\(')
+    SNAKE_CASE_PATTERN = re.compile(r'^[a-z_][a-z0-9_]*$')
+    PASCAL_CASE_PATTERN = re.compile(r'^[A-Z][a-zA-Z0-9]*$')
+    
     def score(self, component: CodeComponent) -> ScoredComponent:
         """
         Score a code component.
@@ -375,12 +425,13 @@ class QualityScorer:
         
         # Correctness (20 pts)
         correctness = 15  # Base
-        try:
-            if component.type != ComponentType.IMPORT:
-                ast.parse(code)
+        error = None
+        if component.type != ComponentType.IMPORT:
+            _, error = parse_python(code)
+        if error is None:
             correctness += 5
-        except SyntaxError as e:
-            issues.append(f"Syntax error: {e}")
+        else:
+            issues.append(f"Syntax error: {error}")
             correctness = 5
         scores["correctness"] = correctness
         
@@ -414,7 +465,7 @@ class QualityScorer:
         if 'time.sleep' in code and 'async' not in code:
             performance -= 3
             issues.append("Blocking sleep in sync code")
-        if re.search(r'for.*in.*range.*len\(', code):
+        if self.RANGE_LEN_PATTERN.search(code):
             performance -= 2
             issues.append("Using range(len()) instead of enumerate")
         if '+ ""' in code or "+ ''" in code:
@@ -432,12 +483,12 @@ class QualityScorer:
                 best_practices += 3
         # Naming conventions
         if component.type == ComponentType.FUNCTION:
-            if re.match(r'^[a-z_][a-z0-9_]*$', component.name):
+            if self.SNAKE_CASE_PATTERN.match(component.name):
                 best_practices += 3
             else:
                 issues.append("Function name not snake_case")
         elif component.type == ComponentType.CLASS:
-            if re.match(r'^[A-Z][a-zA-Z0-9]*$', component.name):
+            if self.PASCAL_CASE_PATTERN.match(component.name):
                 best_practices += 3
             else:
                 issues.append("Class name not PascalCase")
@@ -656,14 +707,10 @@ class SyntaxValidator:
     
     def _validate_python(self, code: str) -> Tuple[bool, List[str]]:
         """Validate Python syntax."""
-        errors = []
-        
-        try:
-            ast.parse(code)
+        _, error = parse_python(code)
+        if error is None:
             return True, []
-        except SyntaxError as e:
-            errors.append(f"Line {e.lineno}: {e.msg}")
-            return False, errors
+        return False, [f"Line {error.lineno}: {error.msg}"]
 
 
 # =============================================================================
@@ -823,7 +870,17 @@ class ConsensusMerger:
 
 if __name__ == "__main__":
     import argparse
-    import json
+    
+    try:
+        import orjson
+        
+        def _dumps(obj) -> str:
+            return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
+    except ImportError:
+        import json
+        
+        def _dumps(obj) -> str:
+            return json.dumps(obj, indent=2)
     
     parser = argparse.ArgumentParser(description="Consensus Merger")
     parser.add_argument("--demo", action="store_true", help="Run demo")
@@ -912,7 +969,7 @@ def create_user(user: User):
         result = merger.merge(outputs)
         
         if args.json:
-            print(json.dumps(result.to_dict(), indent=2))
+            print(_dumps(result.to_dict()))
         else:
             print(result.merged_code)
     
@@ -20,7 +20,6 @@ Usage:
 """
 
 import asyncio
-import json
 import re
 import subprocess
 import time
@@ -29,9 +28,26 @@ from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
+from functools import lru_cache
 from typing import Dict, List, Optional, Protocol, Tuple, Any
 from pathlib import Path
 
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None  # Fall back to per-keyword substring scans
+
+try:
+    import orjson
+
+    def _dumps(obj) -> str:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
+except ImportError:
+    import json
+
+    def _dumps(obj) -> str:
+        return json.dumps(obj, indent=2)
+
 
 # =============================================================================
 # EXECUTION MODES
@@ -49,7 +65,7 @@ class ExecutionMode(Enum):
 # DATA CLASSES
 # =============================================================================
 
-@dataclass
+@dataclass(slots=True)
 class ModelOutput:
     """Output from a single model execution."""
     model: str
@@ -341,22 +357,94 @@ CATEGORY_KEYWORDS = {
     "architecture": ["architecture", "design", "system", "scale", "pattern", "microservice"]
 }
 
+
+def _build_keyword_automaton(keyword_table: Dict[str, List[str]]):
+    """Build one automaton mapping each keyword to the categories listing it.
+
+    Returns None when pyahocorasick is not installed.
+    """
+    if ahocorasick is None:
+        return None
+    needles: Dict[str, List[str]] = {}
+    for cat, keywords in keyword_table.items():
+        for kw in keywords:
+            needles.setdefault(kw, []).append(cat)
+    automaton = ahocorasick.Automaton()
+    for needle, cats in needles.items():
+        automaton.add_word(needle, (needle, tuple(cats)))
+    automaton.make_automaton()
+    return automaton
+
+
+_CATEGORY_AUTOMATON = _build_keyword_automaton(CATEGORY_KEYWORDS)
+
+
+def _category_matches(task_lower: str) -> Dict[str, int]:
+    """Count distinct CATEGORY_KEYWORDS hits per category in one pass over the task."""
+    if _CATEGORY_AUTOMATON is None:
+        return {
+            cat: sum(1 for kw in keywords if kw in task_lower)
+            for cat, keywords in CATEGORY_KEYWORDS.items()
+        }
+    matched = {value for _, value in _CATEGORY_AUTOMATON.iter(task_lower)}
+    counts: Dict[str, int] = {}
+    for _, cats in matched:
+        for cat in cats:
+            counts[cat] = counts.get(cat, 0) + 1
+    return counts
+
+
+# Complexity indicators, checked in order; the first group with a hit sets the mode
+COMPLEXITY_INDICATORS = (
+    (ExecutionMode.SIMPLE, ("simple", "basic", "quick", "small", "function", "helper")),
+    (ExecutionMode.COMPLEX, ("complex", "full", "complete", "system", "integration", "multi")),
+    (ExecutionMode.ARCHITECTURAL, ("architecture", "design", "scale", "enterprise", "platform")),
+)
+
 # Model routing by category
 CATEGORY_ROUTING = {
-    "frontend": (["gemini", "claude-code"], "codex"),
-    "backend": (["claude-code", "codex"], "gemini"),
-    "devops": (["codex", "grok"], "claude-code"),
-    "scripts": (["codex", "gemini"], "claude-code"),
-    "data": (["codex", "claude-code"], "gemini"),
-    "architecture": (["grok", "claude-code"], "codex"),
-    "generic": (["claude-code", "codex"], "gemini")
+    "frontend": (("gemini", "claude-code"), "codex"),
+    "backend": (("claude-code", "codex"), "gemini"),
+    "devops": (("codex", "grok"), "claude-code"),
+    "scripts": (("codex", "gemini"), "claude-code"),
+    "data": (("codex", "claude-code"), "gemini"),
+    "architecture": (("grok", "claude-code"), "codex"),
+    "generic": (("claude-code", "codex"), "gemini")
 }
 
+# All indicators in one pass: the lookahead reports a match at every start
+# position, and alternatives are ordered by group so the highest-priority
+# indicator starting at a position wins
+def _indicator_ranks() -> Dict[str, int]:
+    """Map each indicator to the index of the first group listing it."""
+    ranks: Dict[str, int] = {}
+    for rank, (_, indicators) in enumerate(COMPLEXITY_INDICATORS):
+        for ind in indicators:
+            ranks.setdefault(ind, rank)
+    return ranks
+
+
+_INDICATOR_RANK = _indicator_ranks()
+_COMPLEXITY_RE = re.compile("(?=(" + "|".join(map(re.escape, _INDICATOR_RANK)) + "))")
+
+# Every model, in the priority order used when picking extra validators
+ALL_MODELS = ("claude-code", "codex", "gemini", "grok")
+
+# Models per execution mode: (primary count, validator count); None = all models
+MODE_POLICY = {
+    ExecutionMode.SIMPLE: (1, 0),
+    ExecutionMode.MEDIUM: (2, 1),
+    ExecutionMode.COMPLEX: (2, 2),
+    ExecutionMode.ARCHITECTURAL: (None, 0),
+}
 
+
+@lru_cache(maxsize=1024)
 def analyze_task(task: str) -> Tuple[str, ExecutionMode]:
     """
     Analyze task to determine category and execution mode.
     Uses TaskRouter for intelligent routing when available.
+    Results are memoized per task string; analysis is deterministic.
     
     Returns: (category, execution_mode)
     """
@@ -384,28 +472,23 @@ def analyze_task(task: str) -> Tuple[str, ExecutionMode]:
         
         category = "generic"
         max_matches = 0
-        for cat, keywords in CATEGORY_KEYWORDS.items():
-            matches = sum(1 for kw in keywords if kw in task_lower)
+        cat_matches = _category_matches(task_lower)
+        for cat in CATEGORY_KEYWORDS:
+            matches = cat_matches.get(cat, 0)
             if matches > max_matches:
                 max_matches = matches
                 category = cat
         
-        complexity_indicators = {
-            "simple": ["simple", "basic", "quick", "small", "function", "helper"],
-            "complex": ["complex", "full", "complete", "system", "integration", "multi"],
-            "architecture": ["architecture", "design", "scale", "enterprise", "platform"]
-        }
+        # Lowest-ranked (earliest) indicator group with any hit sets the mode
+        best_rank = len(COMPLEXITY_INDICATORS)
+        for match in _COMPLEXITY_RE.finditer(task_lower):
+            best_rank = min(best_rank, _INDICATOR_RANK[match.group(1)])
+            if best_rank == 0:
+                break
         
         mode = ExecutionMode.MEDIUM
-        for mode_name, indicators in complexity_indicators.items():
-            if any(ind in task_lower for ind in indicators):
-                if mode_name == "simple":
-                    mode = ExecutionMode.SIMPLE
-                elif mode_name == "complex":
-                    mode = ExecutionMode.COMPLEX
-                elif mode_name == "architecture":
-                    mode = ExecutionMode.ARCHITECTURAL
-                break
+        if best_rank < len(COMPLEXITY_INDICATORS):
+            mode = COMPLEXITY_INDICATORS[best_rank][0]
         
         return category, mode
 
@@ -430,22 +513,17 @@ def get_routing(category: str, mode: ExecutionMode, task: str = "") -> Tuple[Lis
     # Fallback routing
     primaries, default_validator = CATEGORY_ROUTING.get(category, CATEGORY_ROUTING["generic"])
     
-    if mode == ExecutionMode.SIMPLE:
-        return [primaries[0]], []
-    elif mode == ExecutionMode.MEDIUM:
-        return primaries[:2], [default_validator]
-    elif mode == ExecutionMode.COMPLEX:
-        all_models = ["claude-code", "codex", "gemini", "grok"]
-        second_validator = next(
-            (m for m in all_models if m not in primaries and m != default_validator),
-            None
-        )
-        validators = [default_validator]
+    primary_count, validator_count = MODE_POLICY.get(mode, (None, 0))
+    if primary_count is None:  # ARCHITECTURAL: every model, no validators
+        return list(ALL_MODELS), []
+    
+    validators = [default_validator] if validator_count else []
+    if validator_count > 1:
+        taken = {default_validator, *primaries}
+        second_validator = next((m for m in ALL_MODELS if m not in taken), None)
         if second_validator:
             validators.append(second_validator)
-        return primaries[:2], validators
-    else:  # ARCHITECTURAL
-        return ["claude-code", "codex", "gemini", "grok"], []
+    return list(primaries[:primary_count]), validators
 
 
 # =============================================================================
@@ -642,13 +720,9 @@ class Orchestrator:
                 print(f"✅ Validators: {', '.join(validators)}")
             print()
         
-        # Run models in parallel (with progress)
+        # Run models in parallel (with progress); outputs come back scored
         outputs = await self._run_parallel(all_models, task, timeout, verbose, on_progress)
         
-        # Score outputs
-        for output in outputs:
-            output.score = score_output(output, task)
-        
         # Run validation if we have validators
         validation = None
         if validators and len([o for o in outputs if o.success]) >= 2:
@@ -704,7 +778,10 @@ class Orchestrator:
         verbose: bool,
         on_progress: Optional[Any] = None
     ) -> List[ModelOutput]:
-        """Run multiple models in parallel with progress updates."""
+        """Run multiple models in parallel with progress updates.
+
+        Successful outputs are returned with their score already set.
+        """
         
         # Import progress helpers if available
         try:
@@ -734,8 +811,10 @@ class Orchestrator:
             for attempt in range(self.max_retries + 1):
                 output = await runner.run(task, timeout)
                 if output.success:
+                    # Score once here; run() reuses it (failed outputs keep 0.0)
+                    output.score = score_output(output, task)
                     # Emit: model completed
-                    await emit(model_completed, model, score_output(output, task), 
+                    await emit(model_completed, model, output.score,
                               output.execution_time, len(output.code))
                     if verbose:
                         print(f"✅ {model}: {len(output.code)} chars ({output.execution_time:.1f}s)")
@@ -847,7 +926,22 @@ class Orchestrator:
                 pass
         
         callback = progress_handler.emit if progress_handler else None
-        return await self.run(task, on_progress=callback, **kwargs)
+        # Handlers only need emit(); buffered ones also provide flush()
+        flush = getattr(progress_handler, "flush", None)
+        try:
+            result = await self.run(task, on_progress=callback, **kwargs)
+        except BaseException:
+            # Still deliver ORCHESTRATION_FAILED and anything else queued, but
+            # never let a send error replace the exception from run()
+            if flush is not None:
+                try:
+                    await flush()
+                except Exception as e:
+                    print(f"⚠️  Progress flush failed: {e}")
+            raise
+        if flush is not None:
+            await flush()
+        return result
     
     def run_with_updates_sync(self, task: str, **kwargs) -> OrchestratorResult:
         """Synchronous wrapper for run_with_updates()."""
@@ -887,7 +981,7 @@ async def main():
     )
     
     if args.json:
-        print(json.dumps(result.to_dict(), indent=2))
+        print(_dumps(result.to_dict()))
     else:
         print("\n" + "=" * 60)
         print("CONSENSUS CODE")
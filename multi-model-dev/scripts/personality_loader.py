@@ -18,9 +18,37 @@ import fnmatch
 from pathlib import Path
 from datetime import datetime
 
+try:
+    import orjson
+
+    def _dumps(obj) -> str:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
+except ImportError:
+    import json
+
+    def _dumps(obj) -> str:
+        return json.dumps(obj, indent=2)
+
 PERSONALITY_FILE = Path(__file__).parent.parent / "personality.yaml"
 OVERLAYS_DIR = Path(__file__).parent.parent / "personality-overlays"
 
+# System prompt layout; only the variable-length blocks are built per call
+_PROMPT_TEMPLATE = (
+    "You are {name} {emoji}, a {creature}.\n"
+    "{tagline_line}"
+    "\n"
+    "**Personality Traits:**\n"
+    "{traits_block}"
+    "\n"
+    "**Boundaries:**\n"
+    "{boundaries_block}"
+    "\n"
+    "{avoid_block}"
+    "\n"
+    "{addendum_block}"
+    "{contexts_line}"
+)
+
 
 def load_personality() -> dict:
     """Load personality configuration from YAML."""
@@ -131,56 +159,41 @@ def generate_prompt_fragment(config: dict, contexts: list[str] = None, model_id:
     traits = apply_overlay(traits, overlay)
     traits = apply_context_modifiers(traits, contexts, config)
 
-    lines = []
-
-    # Character intro
-    name = char.get("name", "Assistant")
-    emoji = char.get("emoji", "")
-    creature = char.get("creature", "AI assistant")
-    lines.append(f"You are {name} {emoji}, a {creature}.")
-    if char.get("tagline"):
-        lines.append(f"*{char['tagline']}*")
-    lines.append("")
-
-    # Trait descriptions
-    lines.append("**Personality Traits:**")
-    for trait, value in traits.items():
-        desc = trait_to_description(trait, value)
-        lines.append(f"- {desc}")
-    lines.append("")
-
-    # Boundaries
-    lines.append("**Boundaries:**")
-    if boundaries.get("opinions"):
-        lines.append("- Can express genuine opinions")
-    if boundaries.get("pushback"):
-        lines.append("- Can respectfully disagree")
-    if boundaries.get("humor_style"):
-        lines.append(f"- Humor style: {boundaries['humor_style']}")
-    lines.append("")
-
     # Response patterns (merge base + overlay overrides)
     avoid_list = list(responses.get("avoid", []))
     overlay_overrides = overlay.get("response_overrides", {})
     avoid_list.extend(overlay_overrides.get("avoid_extra", []))
 
-    if avoid_list:
-        lines.append("**Avoid phrases like:**")
-        for phrase in avoid_list:
-            lines.append(f'- "{phrase}"')
-    lines.append("")
+    boundary_lines = []
+    if boundaries.get("opinions"):
+        boundary_lines.append("- Can express genuine opinions\n")
+    if boundaries.get("pushback"):
+        boundary_lines.append("- Can respectfully disagree\n")
+    if boundaries.get("humor_style"):
+        boundary_lines.append(f"- Humor style: {boundaries['humor_style']}\n")
 
     # Model-specific addendum
     addendum = overlay.get("system_prompt_addendum", "").strip()
-    if addendum:
-        lines.append(f"**Model-specific guidance ({overlay_info['source']}):**")
-        lines.append(addendum)
-        lines.append("")
-
-    if contexts:
-        lines.append(f"**Active contexts:** {', '.join(contexts)}")
 
-    return "\n".join(lines)
+    fragment = _PROMPT_TEMPLATE.format_map({
+        "name": char.get("name", "Assistant"),
+        "emoji": char.get("emoji", ""),
+        "creature": char.get("creature", "AI assistant"),
+        "tagline_line": f"*{char['tagline']}*\n" if char.get("tagline") else "",
+        "traits_block": "".join(f"- {trait_to_description(t, v)}\n" for t, v in traits.items()),
+        "boundaries_block": "".join(boundary_lines),
+        "avoid_block": (
+            "**Avoid phrases like:**\n" + "".join(f'- "{phrase}"\n' for phrase in avoid_list)
+            if avoid_list else ""
+        ),
+        "addendum_block": (
+            f"**Model-specific guidance ({overlay_info['source']}):**\n{addendum}\n\n"
+            if addendum else ""
+        ),
+        "contexts_line": f"**Active contexts:** {', '.join(contexts)}\n" if contexts else "",
+    })
+    # Every template line carries its own terminator; drop the final one
+    return fragment[:-1]
 
 
 def compare_models(config: dict):
@@ -264,7 +277,6 @@ def main():
         print(generate_prompt_fragment(config, contexts, args.model))
 
     elif args.json:
-        import json
         traits = config.get("traits", {})
         if args.model:
             overlay_info = load_overlay(args.model)
@@ -276,7 +288,7 @@ def main():
             "contexts": contexts,
             "model": args.model or "default",
         }
-        print(json.dumps(output, indent=2))
+        print(_dumps(output))
 
     else:
         # Default: print summary
@@ -17,6 +17,7 @@ Usage:
     
     progress = OpenClawProgress()
     result = await orch.run(task, on_progress=progress.emit)
+    await progress.flush()
 """
 
 import asyncio
@@ -117,6 +118,9 @@ class ProgressHandler:
     async def emit(self, progress: Progress) -> None:
         """Handle a progress event."""
         raise NotImplementedError
+    
+    async def flush(self) -> None:
+        """Deliver any buffered events. No-op for unbuffered handlers."""
 
 
 class ConsoleProgress(ProgressHandler):
@@ -165,42 +169,86 @@ class OpenClawProgress(ProgressHandler):
         self.batch_events = batch_events
         self.verbose = verbose
         self._last_send = 0
-        self._pending: list[Progress] = []
-        self._lock = asyncio.Lock()
+        self._queue: Optional[asyncio.Queue] = None
+        self._consumer: Optional[asyncio.Task] = None
+        self._errors: list[Exception] = []
     
     async def emit(self, progress: Progress) -> None:
         """Send progress to OpenClaw channel."""
-        async with self._lock:
+        if self.batch_events:
+            # Producers only enqueue; the consumer task batches and throttles.
+            # A consumer left over from an earlier event loop can never run
+            # again, so start a fresh one on the current loop.
+            if not self._consumer_is_live():
+                self._queue = asyncio.Queue()
+                self._consumer = asyncio.create_task(self._drain())
+            self._queue.put_nowait(progress)
+        else:
+            # Send immediately (respecting throttle)
             now = datetime.now().timestamp() * 1000
+            if now - self._last_send >= self.throttle_ms:
+                await self._send_message(progress.format(self.verbose))
+                self._last_send = now
+    
+    async def flush(self) -> None:
+        """
+        Wait until every queued event has been sent, then stop the consumer.
+        
+        Raises the first send error seen since the last flush.
+        """
+        if self._consumer_is_live():
+            await self._queue.join()
+        await self.aclose()
+        if self._errors:
+            error, self._errors = self._errors[0], []
+            raise error
+    
+    async def aclose(self) -> None:
+        """Cancel the consumer task without waiting for pending events."""
+        consumer, self._consumer, self._queue = self._consumer, None, None
+        if consumer is None or consumer.done():
+            return
+        if consumer.get_loop() is not asyncio.get_running_loop():
+            return  # Its loop is gone; nothing left to await
+        consumer.cancel()
+        try:
+            await consumer
+        except asyncio.CancelledError:
+            pass
+    
+    def _consumer_is_live(self) -> bool:
+        """True if the consumer task can still run on the current loop."""
+        return (
+            self._consumer is not None
+            and not self._consumer.done()
+            and self._consumer.get_loop() is asyncio.get_running_loop()
+        )
+    
+    async def _drain(self) -> None:
+        """Consume queued events, sending everything pending as one message."""
+        queue = self._queue
+        while True:
+            batch = [await queue.get()]
+            try:
+                while True:
+                    batch.append(queue.get_nowait())
+            except asyncio.QueueEmpty:
+                pass
+            
+            try:
+                await self._send_batch(batch)
+            except Exception as e:
+                self._errors.append(e)
+            finally:
+                for _ in batch:
+                    queue.task_done()
             
-            if self.batch_events:
-                self._pending.append(progress)
-                
-                # Check if we should send now
-                if now - self._last_send >= self.throttle_ms:
-                    await self._send_batch()
-                else:
-                    # Schedule send after throttle period
-                    await asyncio.sleep(self.throttle_ms / 1000)
-                    if self._pending:
-                        await self._send_batch()
-            else:
-                # Send immediately (respecting throttle)
-                if now - self._last_send >= self.throttle_ms:
-                    await self._send_message(progress.format(self.verbose))
-                    self._last_send = now
+            await asyncio.sleep(self.throttle_ms / 1000)
     
-    async def _send_batch(self) -> None:
+    async def _send_batch(self, batch: list[Progress]) -> None:
         """Send batched events as single message."""
-        if not self._pending:
-            return
-        
-        # Format all pending events
-        lines = [p.format(self.verbose) for p in self._pending]
-        message = "\n".join(lines)
-        
+        message = "\n".join(p.format(self.verbose) for p in batch)
         await self._send_message(message)
-        self._pending = []
         self._last_send = datetime.now().timestamp() * 1000
     
     async def _send_message(self, message: str) -> None:
@@ -8,6 +8,8 @@ Usage:
     python3 router.py "debug this code" --verbose         # Detailed scoring
     python3 router.py --test                              # Run test suite
     python3 router.py --stats                             # Show routing stats from log
+    python3 router.py --daemon                            # Serve warm routing on a Unix socket
+    ARGUS_ROUTER_SOCK=/tmp/argus-router.sock python3 router.py "hi"   # Route via the daemon
 
 Integrates with OpenClaw via session_status(model=...) for live switching.
 """
@@ -15,18 +17,48 @@ Integrates with OpenClaw via session_status(model=...) for live switching.
 import re
 import json
 import argparse
+import contextlib
+import io
+import os
+import pickle
 import sys
+import time
+from collections import Counter, OrderedDict, namedtuple
+from functools import lru_cache
 from pathlib import Path
 from datetime import datetime
 from typing import Optional
 
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None  # Fall back to per-keyword substring scans
+
+try:
+    import orjson
+
+    def _dumps(obj, indent: bool = False) -> str:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0).decode()
+
+    _loads = orjson.loads
+except ImportError:
+    def _dumps(obj, indent: bool = False) -> str:
+        return json.dumps(obj, indent=2 if indent else None)
+
+    _loads = json.loads
+
 ROUTING_CONFIG = Path(__file__).parent.parent / "routing.yaml"
 ROUTING_LOG = Path(__file__).parent.parent / "routing-log.jsonl"
 STATE_FILE = Path(__file__).parent.parent / "routing-state.json"
+STATS_FILE = Path(__file__).parent.parent / "routing-stats.json"
+DEFAULT_SOCKET = "/tmp/argus-router.sock"
 
 
 def load_config() -> dict:
-    """Load routing configuration from YAML."""
+    """Load routing configuration from YAML (cached until routing.yaml changes).
+
+    The returned dict is shared between callers; treat it as read-only.
+    """
     try:
         import yaml
     except ImportError:
@@ -37,15 +69,48 @@ def load_config() -> dict:
         print(f"Error: Routing config not found: {ROUTING_CONFIG}")
         sys.exit(1)
 
-    with open(ROUTING_CONFIG) as f:
-        return yaml.safe_load(f)
+    st = ROUTING_CONFIG.stat()
+    return _load_config_cached(ROUTING_CONFIG, (st.st_mtime_ns, st.st_size))
+
+
+@lru_cache(maxsize=4)
+def _load_config_cached(path: Path, stamp: tuple) -> dict:
+    """Parse routing.yaml; its (mtime_ns, size) stamp is part of the key so edits are picked up.
+
+    Nanosecond mtime plus size catches edits that float seconds can miss,
+    such as two writes within one timestamp granule. The parsed dict is also
+    pickled next to the YAML (routing.pkl) together with the stamp it was
+    built from, so later processes skip YAML parsing until the file changes
+    again.
+    """
+    cache_file = path.with_suffix(".pkl")
+    try:
+        cached_stamp, config = pickle.loads(cache_file.read_bytes())
+        if cached_stamp == stamp:
+            return config
+    except Exception:
+        pass  # Missing, corrupt or stale cache (unpickling can raise almost anything) — reparse
+
+    import yaml
+
+    loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+    with open(path) as f:
+        config = yaml.load(f, Loader=loader)
+
+    try:
+        tmp_file = cache_file.with_suffix(f".pkl.{os.getpid()}")
+        tmp_file.write_bytes(pickle.dumps((stamp, config), protocol=pickle.HIGHEST_PROTOCOL))
+        os.replace(tmp_file, cache_file)
+    except OSError:
+        pass  # Read-only checkout — just parse every time
+    return config
 
 
 def load_state() -> dict:
     """Load routing state (sticky model, history)."""
     if STATE_FILE.exists():
-        with open(STATE_FILE) as f:
-            return json.load(f)
+        with open(STATE_FILE, "rb") as f:
+            return _loads(f.read())
     return {"sticky_model": None, "sticky_category": None, "sticky_turns_left": 0, "history": []}
 
 
@@ -54,21 +119,317 @@ def save_state(state: dict):
     # Keep history trimmed to last 50
     state["history"] = state.get("history", [])[-50:]
     with open(STATE_FILE, "w") as f:
-        json.dump(state, f, indent=2)
+        f.write(_dumps(state, indent=True))
+
+
+# (epoch second, formatted timestamp) for the last _ts() call
+_TS_CACHE = (None, "")
+
+
+def _ts() -> str:
+    """Local ISO timestamp at second resolution, formatted once per second."""
+    global _TS_CACHE
+    now = int(time.time())
+    if _TS_CACHE[0] != now:
+        _TS_CACHE = (now, datetime.fromtimestamp(now).isoformat(timespec="seconds"))
+    return _TS_CACHE[1]
 
 
-def log_routing(query: str, category: str, model: str, confidence: float, scores: dict):
-    """Append routing decision to log for analytics."""
+def log_routing(query: str, category: str, model: str, confidence: float, scores: dict, fsync: bool = False):
+    """Append routing decision to log for analytics.
+
+    The line is serialized up front and appended with a single O_APPEND
+    write, so concurrent routers never interleave partial lines.
+    """
     entry = {
-        "ts": datetime.now().isoformat(),
+        "ts": _ts(),
         "query": query[:200],
         "category": category,
         "model": model,
         "confidence": round(confidence, 3),
         "scores": {k: round(v, 3) for k, v in scores.items()},
     }
-    with open(ROUTING_LOG, "a") as f:
-        f.write(json.dumps(entry) + "\n")
+    line = (_dumps(entry) + "\n").encode()
+    fd = os.open(ROUTING_LOG, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+    try:
+        os.write(fd, line)
+        if fsync:
+            os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+# Derived lookup tables for a loaded config, built once per config object
+_CompiledConfig = namedtuple("_CompiledConfig", [
+    # Scored categories (all but "default") as parallel tuples, indexed by slot
+    "cat_names",
+    "cat_keywords",     # lowercased keyword tuple per category
+    "cat_patterns",     # lowercased pattern tuple per category
+    "cat_priority",
+    "automaton",        # pyahocorasick automaton: needle -> hit counter indices, or None
+    "prefilters",       # compiled alternation per category (None if no signals), fallback path only
+    "any_signal",       # compiled alternation of every signal (None if none), fallback path only
+    "priority",         # {category: priority}
+    "category_model",   # {category: model key}
+    "default_model",    # model key for the "default" category
+    "cost_rank",        # {model key: 0 (low) .. 2 (high)}
+    "sticky_set",       # frozenset of sticky categories
+    "override_prefix",  # lowercased "/route " prefix
+    "override_models",  # {model key or alias: model key} for /route overrides
+    "threshold",
+    "cost_aware",
+    "cost_threshold",
+    "decisions",        # LRU of query -> decision, dropped with the config
+])
+
+COST_ORDER = {"low": 0, "medium": 1, "high": 2}
+DECISION_CACHE_SIZE = 4096
+
+# (config, compiled) for the most recently classified config
+_COMPILED_CACHE = None
+
+
+def _alternation(needles) -> re.Pattern:
+    """Compile literal needles into one regex, longest first."""
+    return re.compile("|".join(map(re.escape, sorted(set(needles), key=len, reverse=True))))
+
+
+def _compile_config(config: dict) -> _CompiledConfig:
+    """Precompute signal tuples, keyword automaton and rule lookups for a config.
+
+    Scored categories are flattened into parallel tuples so the hot path walks
+    flat sequences by index instead of nested dicts. Keywords and patterns are
+    lowercased once here instead of on every query. Hits are tallied in one flat counter
+    list: keyword hits for category i at 2*i, pattern hits at 2*i + 1. The
+    automaton maps each needle to the counter indices it bumps, so a single
+    pass over the query yields every hit. Cached per config object, which
+    load_config() keeps stable until routing.yaml changes.
+    """
+    global _COMPILED_CACHE
+    if _COMPILED_CACHE is not None and _COMPILED_CACHE[0] is config:
+        return _COMPILED_CACHE[1]
+
+    categories = config.get("categories", {})
+    rules = config.get("rules", {})
+    models = config.get("models", {})
+
+    cat_names = tuple(name for name in categories if name != "default")
+    # Signals are matched against the lowercased query, so lowercase them here
+    # too; interning lets repeated needles share one string object.
+    cat_keywords = tuple(
+        tuple(sys.intern(k.lower()) for k in categories[name].get("signals", {}).get("keywords", []))
+        for name in cat_names
+    )
+    cat_patterns = tuple(
+        tuple(sys.intern(p.lower()) for p in categories[name].get("signals", {}).get("patterns", []))
+        for name in cat_names
+    )
+
+    automaton = None
+    if ahocorasick is not None:
+        # A needle listed twice in one category counts twice, as in the scan
+        needles = {}
+        for i, (keywords, patterns) in enumerate(zip(cat_keywords, cat_patterns)):
+            for kw in keywords:
+                needles.setdefault(kw, []).append(2 * i)
+            for p in patterns:
+                needles.setdefault(p, []).append(2 * i + 1)
+        if needles:
+            automaton = ahocorasick.Automaton()
+            for needle, slots in needles.items():
+                automaton.add_word(needle, (needle, tuple(slots)))
+            automaton.make_automaton()
+
+    # Without pyahocorasick, one C-level regex search per category rules out
+    # categories with no hits before their signals are counted one by one.
+    # A global alternation rejects queries with no signal at all in one search.
+    prefilters = ()
+    any_signal = None
+    if ahocorasick is None:
+        prefilters = tuple(
+            _alternation(kw + pat) if kw or pat else None
+            for kw, pat in zip(cat_keywords, cat_patterns)
+        )
+        all_needles = sum(cat_keywords + cat_patterns, ())
+        if all_needles:
+            any_signal = _alternation(all_needles)
+
+    # First model whose key or alias matches wins, as in a scan over models
+    override_models = {}
+    for key, m in models.items():
+        override_models.setdefault(key, key)
+        if m.get("alias") is not None:
+            override_models.setdefault(m["alias"], key)
+
+    category_model = {name: cat.get("model", "claude") for name, cat in categories.items()}
+    compiled = _CompiledConfig(
+        cat_names=cat_names,
+        cat_keywords=cat_keywords,
+        cat_patterns=cat_patterns,
+        cat_priority=tuple(categories[name].get("priority", 0) for name in cat_names),
+        automaton=automaton,
+        prefilters=prefilters,
+        any_signal=any_signal,
+        priority={name: cat.get("priority", 0) for name, cat in categories.items()},
+        category_model=category_model,
+        default_model=category_model.get("default", "claude"),
+        cost_rank={key: COST_ORDER.get(m.get("cost_tier", "high"), 2) for key, m in models.items()},
+        sticky_set=frozenset(rules.get("sticky_categories", [])),
+        override_prefix=rules.get("override_prefix", "/route ").lower(),
+        override_models=override_models,
+        threshold=rules.get("confidence_threshold", 0.6),
+        cost_aware=rules.get("cost_aware"),
+        cost_threshold=rules.get("cost_threshold", 0.1),
+        decisions=OrderedDict(),
+    )
+    _COMPILED_CACHE = (config, compiled)
+    return compiled
+
+
+def _signal_hits(query_lower: str, compiled: _CompiledConfig, exact: bool = False) -> list:
+    """Count distinct keyword and pattern hits per category as a flat counter list.
+
+    Keyword hits for category i are at index 2*i, pattern hits at 2*i + 1.
+    Unless exact is set, the fallback scan stops counting a category's
+    keywords or patterns once its score component has saturated.
+    """
+    counts = [0] * (2 * len(compiled.cat_names))
+
+    if ahocorasick is not None:
+        if compiled.automaton is not None:
+            matched = {value for _, value in compiled.automaton.iter(query_lower)}
+            for _, slots in matched:
+                for slot in slots:
+                    counts[slot] += 1
+        return counts
+
+    if compiled.any_signal is None or not compiled.any_signal.search(query_lower):
+        return counts
+
+    kw_limit = None if exact else _KW_SATURATION
+    pat_limit = None if exact else _PAT_SATURATION
+    for i, prefilter in enumerate(compiled.prefilters):
+        if prefilter is None or not prefilter.search(query_lower):
+            continue
+        keyword_hits = 0
+        for kw in compiled.cat_keywords[i]:
+            if kw in query_lower:
+                keyword_hits += 1
+                if keyword_hits == kw_limit:
+                    break
+        pattern_hits = 0
+        for p in compiled.cat_patterns[i]:
+            if p in query_lower:
+                pattern_hits += 1
+                if pattern_hits == pat_limit:
+                    break
+        counts[2 * i] = keyword_hits
+        counts[2 * i + 1] = pattern_hits
+    return counts
+
+
+def _category_score(keyword_hits: int, pattern_hits: int) -> float:
+    """Score a category from its distinct keyword and pattern hit counts."""
+    score = 0.0
+
+    # Keyword matching — any hit is a strong signal
+    if keyword_hits > 0:
+        # First hit gives 0.5, each additional adds 0.15
+        score += min(0.5 + (keyword_hits - 1) * 0.15, 0.8)
+
+    # Pattern matching — multi-word patterns are high-value, specific signals
+    if pattern_hits > 0:
+        # First hit gives 0.55, each additional adds 0.15
+        score += min(0.55 + (pattern_hits - 1) * 0.15, 0.7)
+
+    # Cap at 1.0
+    score = min(score, 1.0)
+
+    # Boost for multiple signal types hitting
+    if keyword_hits > 0 and pattern_hits > 0:
+        score = min(score * 1.1, 1.0)
+
+    return score
+
+
+# Both components saturate (3 keywords -> 0.8, 2 patterns -> 0.7), so every
+# possible score fits in a small table indexed by clamped hit counts.
+_KW_SATURATION = 3
+_PAT_SATURATION = 2
+SCORE_TABLE = tuple(
+    tuple(_category_score(k, p) for p in range(_PAT_SATURATION + 1))
+    for k in range(_KW_SATURATION + 1)
+)
+
+
+def _score_kernel(counts: list, compiled: _CompiledConfig) -> tuple:
+    """Turn flat hit counters into (scores, best, second) with no I/O.
+
+    best and second are the top two (category, score) pairs by score, then
+    priority for ties, earlier categories first (None when absent).
+    """
+    cat_names = compiled.cat_names
+    cat_priority = compiled.cat_priority
+    score_list = [
+        SCORE_TABLE[min(keyword_hits, _KW_SATURATION)][min(pattern_hits, _PAT_SATURATION)]
+        for keyword_hits, pattern_hits in zip(counts[0::2], counts[1::2])
+    ]
+    # Single pass for the top two; strict > keeps the earlier category on ties
+    best = second = None
+    best_key = second_key = None
+    for i, key in enumerate(zip(score_list, cat_priority)):
+        if best is None or key > best_key:
+            second, second_key = best, best_key
+            best, best_key = i, key
+        elif second is None or key > second_key:
+            second, second_key = i, key
+
+    scores = dict(zip(cat_names, score_list))
+    best = None if best is None else (cat_names[best], score_list[best])
+    second = None if second is None else (cat_names[second], score_list[second])
+    return scores, best, second
+
+
+def _decide(query_lower: str, compiled: _CompiledConfig, verbose: bool = False) -> tuple:
+    """Score categories for a query and pick (category, model_key, confidence, scores)."""
+    # Verbose output reports true hit counts, so skip the saturation cutoff
+    counts = _signal_hits(query_lower, compiled, exact=verbose)
+    scores, best, second = _score_kernel(counts, compiled)
+
+    if verbose:
+        for i, cat_name in enumerate(compiled.cat_names):
+            keyword_hits, pattern_hits = counts[2 * i], counts[2 * i + 1]
+            print(f"  {cat_name:20} score={scores[cat_name]:.3f} (kw={keyword_hits}/{len(compiled.cat_keywords[i])}, pat={pattern_hits}/{len(compiled.cat_patterns[i])})")
+
+    # Find best category
+    priority = compiled.priority
+    if best is not None:
+        best_cat, best_score = best
+    else:
+        best_cat, best_score = "default", 0.0
+
+    # Apply confidence threshold
+    if best_score < compiled.threshold:
+        best_cat = "default"
+        best_score = 1.0 - best_score  # Invert: high confidence in default
+
+    # Get model for category
+    model_key = compiled.category_model.get(best_cat, compiled.default_model)
+
+    # Cost-aware tie-breaking — only between same-priority categories
+    if compiled.cost_aware and second is not None:
+        second_cat, second_score = second
+        cost_threshold = compiled.cost_threshold
+        if abs(best_score - second_score) < cost_threshold and priority.get(best_cat, 0) <= priority.get(second_cat, 0):
+            second_model_key = compiled.category_model[second_cat]
+            cost_rank = compiled.cost_rank
+            if cost_rank.get(second_model_key, 2) < cost_rank.get(model_key, 2):
+                model_key = second_model_key
+                best_cat = second_cat
+                if verbose:
+                    print(f"  → Cost-aware switch: {model_key} (cheaper, same priority, scores within {cost_threshold})")
+
+    return best_cat, model_key, best_score, scores
 
 
 def classify(query: str, config: dict, state: dict, verbose: bool = False) -> dict:
@@ -87,26 +448,25 @@ def classify(query: str, config: dict, state: dict, verbose: bool = False) -> di
         }
     """
     query_lower = query.lower().strip()
-    categories = config.get("categories", {})
-    rules = config.get("rules", {})
+    compiled = _compile_config(config)
     models = config.get("models", {})
 
     # Check for user override: "/route grok ..."
-    override_prefix = rules.get("override_prefix", "/route ")
-    if query_lower.startswith(override_prefix.lower()):
+    override_prefix = compiled.override_prefix
+    if query_lower.startswith(override_prefix):
         parts = query[len(override_prefix):].strip().split(" ", 1)
         requested_model = parts[0].lower()
-        for key, m in models.items():
-            if key == requested_model or m.get("alias") == requested_model:
-                return {
-                    "category": "override",
-                    "model_key": key,
-                    "model_id": m["id"],
-                    "confidence": 1.0,
-                    "scores": {},
-                    "reason": f"User override: /route {requested_model}",
-                    "sticky": False,
-                }
+        key = compiled.override_models.get(requested_model)
+        if key is not None:
+            return {
+                "category": "override",
+                "model_key": key,
+                "model_id": models[key]["id"],
+                "confidence": 1.0,
+                "scores": {},
+                "reason": f"User override: /route {requested_model}",
+                "sticky": False,
+            }
         # Unknown model requested
         return {
             "category": "override",
@@ -119,7 +479,6 @@ def classify(query: str, config: dict, state: dict, verbose: bool = False) -> di
         }
 
     # Check sticky state (stay on same model for N turns after certain categories)
-    sticky_categories = rules.get("sticky_categories", [])
     if state.get("sticky_turns_left", 0) > 0 and state.get("sticky_model"):
         model_key = state["sticky_model"]
         model_info = models.get(model_key, {})
@@ -133,92 +492,29 @@ def classify(query: str, config: dict, state: dict, verbose: bool = False) -> di
             "sticky": True,
         }
 
-    # Score each category
-    scores = {}
-    for cat_name, cat_config in categories.items():
-        if cat_name == "default":
-            continue
-
-        score = 0.0
-        signals = cat_config.get("signals", {})
-        keywords = signals.get("keywords", [])
-        patterns = signals.get("patterns", [])
-
-        # Keyword matching — any hit is a strong signal
-        keyword_hits = sum(1 for kw in keywords if kw in query_lower)
-        if keywords and keyword_hits > 0:
-            # First hit gives 0.5, each additional adds 0.15
-            score += min(0.5 + (keyword_hits - 1) * 0.15, 0.8)
-
-        # Pattern matching — multi-word patterns are high-value, specific signals
-        pattern_hits = sum(1 for p in patterns if p.lower() in query_lower)
-        if patterns and pattern_hits > 0:
-            # First hit gives 0.55, each additional adds 0.15
-            score += min(0.55 + (pattern_hits - 1) * 0.15, 0.7)
-
-        # Cap at 1.0
-        score = min(score, 1.0)
-
-        # Boost for multiple signal types hitting
-        if keyword_hits > 0 and pattern_hits > 0:
-            score = min(score * 1.1, 1.0)
-
-        scores[cat_name] = score
-
-        if verbose:
-            print(f"  {cat_name:20} score={score:.3f} (kw={keyword_hits}/{len(keywords)}, pat={pattern_hits}/{len(patterns)})")
-
-    # Find best category
-    if scores:
-        # Sort by score, then by priority for ties
-        ranked = sorted(
-            scores.items(),
-            key=lambda x: (x[1], categories.get(x[0], {}).get("priority", 0)),
-            reverse=True,
-        )
-        best_cat, best_score = ranked[0]
+    # Score categories, reusing the decision for a repeated query
+    decisions = compiled.decisions
+    decision = None if verbose else decisions.get(query_lower)
+    if decision is None:
+        decision = _decide(query_lower, compiled, verbose)
+        decisions[query_lower] = decision
+        if len(decisions) > DECISION_CACHE_SIZE:
+            decisions.popitem(last=False)
     else:
-        best_cat, best_score = "default", 0.0
-
-    # Apply confidence threshold
-    threshold = rules.get("confidence_threshold", 0.6)
-    if best_score < threshold:
-        best_cat = "default"
-        best_score = 1.0 - best_score  # Invert: high confidence in default
-
-    # Get model for category
-    cat_config = categories.get(best_cat, categories.get("default", {}))
-    model_key = cat_config.get("model", "claude")
-    model_info = models.get(model_key, {})
-
-    # Cost-aware tie-breaking — only between same-priority categories
-    if rules.get("cost_aware") and len(ranked) >= 2:
-        second_cat, second_score = ranked[1]
-        cost_threshold = rules.get("cost_threshold", 0.1)
-        best_priority = categories.get(best_cat, {}).get("priority", 0)
-        second_priority = categories.get(second_cat, {}).get("priority", 0)
-        if abs(best_score - second_score) < cost_threshold and best_priority <= second_priority:
-            second_model_key = categories.get(second_cat, {}).get("model", "claude")
-            second_model_info = models.get(second_model_key, {})
-            cost_order = {"low": 0, "medium": 1, "high": 2}
-            if cost_order.get(second_model_info.get("cost_tier", "high"), 2) < cost_order.get(model_info.get("cost_tier", "high"), 2):
-                model_key = second_model_key
-                model_info = second_model_info
-                best_cat = second_cat
-                if verbose:
-                    print(f"  → Cost-aware switch: {model_key} (cheaper, same priority, scores within {cost_threshold})")
+        decisions.move_to_end(query_lower)
+    best_cat, model_key, best_score, scores = decision
 
     # Determine stickiness
-    is_sticky = best_cat in sticky_categories
+    is_sticky = best_cat in compiled.sticky_set
 
     reason = f"Classified as '{best_cat}' (score={best_score:.2f}) → {model_key}"
 
     return {
         "category": best_cat,
         "model_key": model_key,
-        "model_id": model_info.get("id", ""),
+        "model_id": models.get(model_key, {}).get("id", ""),
         "confidence": best_score,
-        "scores": scores,
+        "scores": dict(scores),
         "reason": reason,
         "sticky": is_sticky,
     }
@@ -240,7 +536,7 @@ def update_state(state: dict, result: dict, config: dict) -> dict:
 
     # Append to history
     state.setdefault("history", []).append({
-        "ts": datetime.now().isoformat(),
+        "ts": _ts(),
         "category": result["category"],
         "model": result["model_key"],
     })
@@ -296,50 +592,311 @@ def run_tests(config: dict):
         if not model_ok:
             print(f"    Model: expected={expected_model}, got={result['model_key']}")
 
+    print("\n🛰️  Daemon checks\n")
+    for name, ok in _daemon_checks():
+        if ok:
+            passed += 1
+        else:
+            failed += 1
+        print(f"{'✅' if ok else '❌'} {name}")
+
     print(f"\n📊 Results: {passed}/{passed + failed} passed ({passed / (passed + failed) * 100:.0f}%)")
     return failed == 0
 
 
+def _daemon_checks() -> list:
+    """Round-trip a daemon on a private socket; returns (description, passed) pairs.
+
+    State goes to a temporary directory and nothing is logged, so the checks
+    leave routing-state.json and the routing log untouched.
+    """
+    global STATE_FILE, ROUTING_CONFIG
+    import socket
+    import stat
+    import tempfile
+    import threading
+
+    checks = []
+    with tempfile.TemporaryDirectory() as tmp:
+        sock_path = os.path.join(tmp, "router.sock")
+        saved = STATE_FILE, ROUTING_CONFIG
+        STATE_FILE = Path(tmp) / "routing-state.json"
+        server = _bind_daemon(sock_path, timeout=0.5)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        try:
+            mode = stat.S_IMODE(os.stat(sock_path).st_mode)
+            checks.append(("socket is private to its owner", mode & 0o077 == 0))
+
+            reply = route_via_daemon(sock_path, "debug this Python script for me", no_log=True)
+            checks.append(("daemon round trip", reply is not None and reply["result"]["model_key"] == "claude"))
+
+            # load_config() exits on a missing routing.yaml; the daemon must answer and keep serving
+            ROUTING_CONFIG = Path(tmp) / "missing.yaml"
+            with contextlib.redirect_stdout(io.StringIO()):
+                bad = route_via_daemon(sock_path, "debug this Python script for me", no_log=True)
+            ROUTING_CONFIG = saved[1]
+            again = route_via_daemon(sock_path, "turn on the office lights", no_log=True)
+            checks.append(("daemon survives a bad config", bad is None and again is not None))
+
+            # A client that connects and never sends is dropped after the timeout
+            with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as idle:
+                idle.connect(sock_path)
+                started = time.monotonic()
+                reply = route_via_daemon(sock_path, "turn on the office lights", no_log=True)
+                waited = time.monotonic() - started
+            checks.append(("idle client does not block the daemon", reply is not None and waited < 2))
+        finally:
+            STATE_FILE, ROUTING_CONFIG = saved
+            server.shutdown()
+            server.server_close()
+
+        checks.append(("unreachable daemon falls back", route_via_daemon(sock_path, "hello", no_log=True) is None))
+    return checks
+
+
+def _aggregate_log(data: bytes) -> tuple:
+    """Aggregate JSONL routing entries into (total, category counts, model counts, confidence sum).
+
+    Counts are {name: count} dicts in first-seen order. Uses a single polars
+    scan when polars is installed, otherwise one pass with Counters.
+    """
+    try:
+        import polars as pl
+    except ImportError:
+        pl = None
+
+    if pl is not None:
+        df = pl.read_ndjson(
+            io.BytesIO(data),
+            schema={"category": pl.Utf8, "model": pl.Utf8, "confidence": pl.Float64},
+        )
+        if df.height == 0:
+            return 0, {}, {}, 0
+
+        def counts(column: str) -> dict:
+            grouped = df.group_by(pl.col(column).fill_null("unknown"), maintain_order=True).agg(pl.len())
+            return dict(grouped.iter_rows())
+
+        return df.height, counts("category"), counts("model"), df["confidence"].fill_null(0).sum()
+
+    cat_counts = Counter()
+    model_counts = Counter()
+    conf_sum = 0
+    total = 0
+    for line in data.splitlines():
+        if not line.strip():
+            continue
+        e = _loads(line)
+        total += 1
+        cat_counts[e.get("category", "unknown")] += 1
+        model_counts[e.get("model", "unknown")] += 1
+        conf_sum += e.get("confidence", 0)
+    return total, cat_counts, model_counts, conf_sum
+
+
+def _stats_shape_ok(stats) -> bool:
+    """True if a loaded routing-stats.json has every field update_stats() relies on."""
+    if not isinstance(stats, dict):
+        return False
+    numbers = (int, float)
+    return (
+        all(isinstance(stats.get(key), int) for key in ("inode", "offset", "total"))
+        and isinstance(stats.get("confidence_sum"), numbers)
+        and all(
+            isinstance(stats.get(key), dict)
+            and all(isinstance(count, int) for count in stats[key].values())
+            for key in ("categories", "models")
+        )
+    )
+
+
+def update_stats() -> dict:
+    """Fold log entries appended since the last call into routing-stats.json.
+
+    Only bytes past the stored log offset are read, so the cost scales with
+    new entries rather than the whole history. A log that was replaced or
+    truncated is re-aggregated from the start.
+    """
+    log_stat = ROUTING_LOG.stat()
+    empty = {"inode": log_stat.st_ino, "offset": 0, "total": 0, "categories": {}, "models": {}, "confidence_sum": 0}
+    try:
+        stats = _loads(STATS_FILE.read_bytes())
+    except (OSError, ValueError):
+        stats = empty
+    if not _stats_shape_ok(stats):
+        stats = empty  # Older, hand-edited or foreign file: re-aggregate
+
+    size = log_stat.st_size
+    if stats.get("inode") != log_stat.st_ino or size < stats["offset"]:
+        stats = empty
+
+    with open(ROUTING_LOG, "rb") as f:
+        # Every consumed entry ends in a newline. Anything else means the log
+        # was truncated in place (copytruncate) and has since grown back past
+        # the offset, so the stored counts describe a different file
+        if stats["offset"]:
+            f.seek(stats["offset"] - 1)
+            if f.read(1) != b"\n":
+                stats = empty
+        if size == stats["offset"]:
+            return stats
+        f.seek(stats["offset"])
+        data = f.read()
+    end = data.rfind(b"\n") + 1  # Leave a partially written last line for next time
+    if not end:
+        return stats
+
+    total, cat_counts, model_counts, conf_sum = _aggregate_log(data[:end])
+    for key, counts in (("categories", cat_counts), ("models", model_counts)):
+        merged = stats[key]
+        for name, count in counts.items():
+            merged[name] = merged.get(name, 0) + count
+    stats["total"] += total
+    stats["confidence_sum"] += conf_sum
+    stats["offset"] += end
+
+    try:
+        with open(STATS_FILE, "w") as f:
+            f.write(_dumps(stats))
+    except OSError:
+        pass  # Stats are still correct for this run; next run re-reads the tail
+    return stats
+
+
 def show_stats():
     """Show routing statistics from log."""
     if not ROUTING_LOG.exists():
         print("No routing log found yet.")
         return
 
-    entries = []
-    with open(ROUTING_LOG) as f:
-        for line in f:
-            if line.strip():
-                entries.append(json.loads(line))
-
-    if not entries:
+    stats = update_stats()
+    total = stats["total"]
+    if not total:
         print("No routing entries logged.")
         return
 
-    print(f"📊 Routing Stats ({len(entries)} queries logged)\n")
+    print(f"📊 Routing Stats ({total} queries logged)\n")
 
     # Category distribution
-    cat_counts = {}
-    model_counts = {}
-    for e in entries:
-        cat = e.get("category", "unknown")
-        model = e.get("model", "unknown")
-        cat_counts[cat] = cat_counts.get(cat, 0) + 1
-        model_counts[model] = model_counts.get(model, 0) + 1
-
     print("Categories:")
-    for cat, count in sorted(cat_counts.items(), key=lambda x: -x[1]):
+    for cat, count in Counter(stats["categories"]).most_common():
         bar = "█" * (count * 2)
         print(f"  {cat:20} {bar} {count}")
 
     print("\nModels:")
-    for model, count in sorted(model_counts.items(), key=lambda x: -x[1]):
+    for model, count in Counter(stats["models"]).most_common():
         bar = "█" * (count * 2)
         print(f"  {model:20} {bar} {count}")
 
     # Average confidence
-    avg_conf = sum(e.get("confidence", 0) for e in entries) / len(entries)
-    print(f"\nAvg confidence: {avg_conf:.2f}")
+    print(f"\nAvg confidence: {stats['confidence_sum'] / total:.2f}")
+
+
+def route_query(query: str, config: dict, verbose: bool = False, no_log: bool = False, fsync: bool = False) -> dict:
+    """Classify a query, advance the persisted sticky state and log the decision."""
+    state = load_state()
+    result = classify(query, config, state, verbose=verbose)
+
+    # Update and save state
+    state = update_state(state, result, config)
+    save_state(state)
+
+    # Log unless disabled
+    if not no_log:
+        log_routing(query, result["category"], result["model_key"], result["confidence"], result["scores"], fsync=fsync)
+
+    return result
+
+
+def _bind_daemon(sock_path: str, timeout: float = 5.0):
+    """Bind the router daemon's Unix socket, readable and writable by the owner only.
+
+    Connections are served one at a time, so each gets ``timeout`` seconds
+    to send its request before it is dropped; a silent client cannot stall
+    everyone else.
+    """
+    import socketserver
+
+    class RouteHandler(socketserver.StreamRequestHandler):
+        def handle(self):
+            try:
+                request = _loads(self.rfile.readline())
+                config = load_config()
+                result = route_query(
+                    request["query"], config,
+                    no_log=request.get("no_log", False), fsync=request.get("fsync", False),
+                )
+                reply = {"result": result, "sticky_turns": config.get("rules", {}).get("sticky_turns", 3)}
+            except (Exception, SystemExit) as e:
+                # load_config() exits on a missing or invalid routing.yaml;
+                # report that to the client instead of stopping the daemon
+                reply = {"error": str(e) or type(e).__name__}
+            with contextlib.suppress(OSError):  # Client already gave up
+                self.wfile.write((_dumps(reply) + "\n").encode())
+
+    RouteHandler.timeout = timeout
+
+    with contextlib.suppress(FileNotFoundError):
+        os.unlink(sock_path)
+    old_umask = os.umask(0o077)  # Other local users must not route or log through us
+    try:
+        return socketserver.UnixStreamServer(sock_path, RouteHandler)
+    finally:
+        os.umask(old_umask)
+
+
+def serve(sock_path: str):
+    """Serve routing requests on a Unix socket until interrupted.
+
+    Each connection sends one JSON line ({"query", "no_log", "fsync"}) and gets
+    one JSON line back ({"result", "sticky_turns"} or {"error"}). Requests are
+    handled one at a time in this process, so the parsed config, compiled
+    tables and decision cache stay warm across calls.
+    """
+    import signal
+
+    # Treat SIGTERM like Ctrl-C so the socket file is cleaned up either way
+    signal.signal(signal.SIGTERM, signal.default_int_handler)
+
+    with _bind_daemon(sock_path) as server:
+        print(f"🛰️  Router daemon listening on {sock_path}")
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            with contextlib.suppress(FileNotFoundError):
+                os.unlink(sock_path)
+
+
+def route_via_daemon(sock_path: str, query: str, no_log: bool = False, fsync: bool = False) -> Optional[dict]:
+    """Ask a running router daemon to route a query; None if it is unreachable."""
+    import socket
+
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.settimeout(5)
+            sock.connect(sock_path)
+            sock.sendall((_dumps({"query": query, "no_log": no_log, "fsync": fsync}) + "\n").encode())
+            reply = _loads(sock.makefile("rb").readline())
+    except (OSError, ValueError):
+        return None
+    return None if "error" in reply else reply
+
+
+def print_result(result: dict, sticky_turns: int, as_json: bool = False, verbose: bool = False):
+    """Print a routing decision for the CLI."""
+    if as_json:
+        print(_dumps(result, indent=True))
+    else:
+        if verbose:
+            print()
+        print(f"📍 Category: {result['category']}")
+        print(f"🧠 Model: {result['model_key']} ({result['model_id']})")
+        print(f"📊 Confidence: {result['confidence']:.2f}")
+        print(f"💡 Reason: {result['reason']}")
+        if result.get("sticky"):
+            print(f"📌 Sticky: Will hold this model for next {sticky_turns} turns")
 
 
 def main():
@@ -350,10 +907,25 @@ def main():
     parser.add_argument("--test", action="store_true", help="Run test suite")
     parser.add_argument("--stats", action="store_true", help="Show routing stats")
     parser.add_argument("--no-log", action="store_true", help="Don't log this query")
+    parser.add_argument("--fsync", action="store_true", help="fsync the routing log after appending")
+    parser.add_argument("--daemon", action="store_true", help="Serve routing requests on a Unix socket")
+    parser.add_argument("--socket", default=os.environ.get("ARGUS_ROUTER_SOCK"),
+                        help=f"Daemon socket path (default: $ARGUS_ROUTER_SOCK, or {DEFAULT_SOCKET} for --daemon)")
     args = parser.parse_args()
 
+    # Hand the query to a warm daemon when one is configured; run inline otherwise
+    if args.query and not (args.daemon or args.test or args.stats or args.verbose) and args.socket:
+        reply = route_via_daemon(args.socket, args.query, no_log=args.no_log, fsync=args.fsync)
+        if reply is not None:
+            print_result(reply["result"], reply["sticky_turns"], as_json=args.json)
+            return
+
     config = load_config()
 
+    if args.daemon:
+        serve(args.socket or DEFAULT_SOCKET)
+        return
+
     if args.test:
         success = run_tests(config)
         sys.exit(0 if success else 1)
@@ -366,33 +938,12 @@ def main():
         parser.print_help()
         return
 
-    state = load_state()
-
     if args.verbose:
         print(f"Query: \"{args.query}\"\n")
         print("Scoring:")
 
-    result = classify(args.query, config, state, verbose=args.verbose)
-
-    # Update and save state
-    state = update_state(state, result, config)
-    save_state(state)
-
-    # Log unless disabled
-    if not args.no_log:
-        log_routing(args.query, result["category"], result["model_key"], result["confidence"], result["scores"])
-
-    if args.json:
-        print(json.dumps(result, indent=2))
-    else:
-        if args.verbose:
-            print()
-        print(f"📍 Category: {result['category']}")
-        print(f"🧠 Model: {result['model_key']} ({result['model_id']})")
-        print(f"📊 Confidence: {result['confidence']:.2f}")
-        print(f"💡 Reason: {result['reason']}")
-        if result.get("sticky"):
-            print(f"📌 Sticky: Will hold this model for next {config.get('rules', {}).get('sticky_turns', 3)} turns")
+    result = route_query(args.query, config, verbose=args.verbose, no_log=args.no_log, fsync=args.fsync)
+    print_result(result, config.get("rules", {}).get("sticky_turns", 3), as_json=args.json, verbose=args.verbose)
 
 
 if __name__ == "__main__":
@@ -12,17 +12,23 @@ Run with:
     python test_orchestrator.py              # All tests with mocks
     python test_orchestrator.py --live       # Include live Grok API test
     python test_orchestrator.py --verbose    # Detailed output
+    python test_orchestrator.py --jobs 4     # Run offline sections on 4 threads
 """
 
 import asyncio
 import json
 import sys
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
+from functools import lru_cache, partial
 from typing import List, Tuple
 import os
 
 # Test result tracking
-@dataclass
+@dataclass(slots=True)
 class TestResult:
     name: str
     passed: bool
@@ -34,26 +40,48 @@ class TestRunner:
         self.verbose = verbose
         self.results: List[TestResult] = []
     
+    def run(self, name: str, func, *args, **kwargs):
+        """Run a test function and record its result."""
+        self._record(*self._execute(name, func, *args, **kwargs))
+    
+    def run_batch(self, tests, jobs: int = 1):
+        """
+        Run independent decorated tests, on a thread pool when jobs > 1.
+        
+        Results are recorded and printed in list order either way, so the
+        report reads the same as a serial run.
+        """
+        if jobs <= 1:
+            for test in tests:
+                test()
+            return
+        with ThreadPoolExecutor(max_workers=jobs) as pool:
+            outcomes = list(pool.map(lambda t: self._execute(*t.args, **t.keywords), tests))
+        for outcome in outcomes:
+            self._record(*outcome)
+    
+    def _execute(self, name: str, func, *args, **kwargs) -> Tuple[TestResult, str]:
+        """Call a test function; return its result and the message to print."""
+        try:
+            result = func(*args, **kwargs)
+            if result is True or result is None:
+                return TestResult(name, True, "PASS"), ""
+            elif isinstance(result, tuple):
+                passed, msg = result
+                return TestResult(name, passed, "PASS" if passed else "FAIL", msg), msg
+            else:
+                return TestResult(name, False, "FAIL", str(result)), str(result)
+        except Exception as e:
+            return TestResult(name, False, "ERROR", str(e)), f"Exception: {e}"
+    
+    def _record(self, result: TestResult, msg: str):
+        self.results.append(result)
+        self._print_result(result.name, result.passed, msg)
+    
     def test(self, name: str):
-        """Decorator for test functions."""
+        """Decorator for test functions; calling the decorated test runs it via run()."""
         def decorator(func):
-            def wrapper(*args, **kwargs):
-                try:
-                    result = func(*args, **kwargs)
-                    if result is True or result is None:
-                        self.results.append(TestResult(name, True, "PASS"))
-                        self._print_result(name, True, "")
-                    elif isinstance(result, tuple):
-                        passed, msg = result
-                        self.results.append(TestResult(name, passed, "PASS" if passed else "FAIL", msg))
-                        self._print_result(name, passed, msg)
-                    else:
-                        self.results.append(TestResult(name, False, "FAIL", str(result)))
-                        self._print_result(name, False, str(result))
-                except Exception as e:
-                    self.results.append(TestResult(name, False, "ERROR", str(e)))
-                    self._print_result(name, False, f"Exception: {e}")
-            return wrapper
+            return partial(self.run, name, func)
         return decorator
     
     def _print_result(self, name: str, passed: bool, msg: str):
@@ -213,11 +241,42 @@ async def create_user(user: UserInput):
 # TESTS
 # =============================================================================
 
-def run_tests(verbose: bool = False, live: bool = False):
-    """Run all orchestrator tests."""
+def run_tests(verbose: bool = False, live: bool = False, jobs: int = 1):
+    """Run all orchestrator tests; jobs > 1 runs each offline section on a thread pool."""
     
     runner = TestRunner(verbose=verbose)
     
+    # Resolve everything the tests need once, not per closure. The router is
+    # bound as a module so a missing class fails its own test, not the suite.
+    import router
+    from merger import (
+        CodeBlockParser, PythonComponentParser, ComponentType, QualityScorer,
+        CodeComponent, ConsensusMerger, SyntaxValidator,
+    )
+    from validator import (
+        select_validator, ValidationResult, ValidationStatus, should_escalate,
+        Validator, ValidationCache, TokenBucket,
+    )
+    from orchestrator import (
+        analyze_task, ExecutionMode, get_routing, score_output, ModelOutput, merge_outputs,
+        Orchestrator,
+    )
+    from progress import OpenClawProgress, task_received
+    from benchmark import BENCHMARK_TASKS, TOTAL_WEIGHT
+    
+    # The parsers and scorers are stateless once built, so every test shares
+    # one instance. The router is built on first use for the same reason the
+    # module is bound above.
+    block_parser = CodeBlockParser()
+    component_parser = PythonComponentParser()
+    scorer = QualityScorer()
+    consensus = ConsensusMerger()
+    syntax_validator = SyntaxValidator()
+    
+    @lru_cache(maxsize=None)
+    def shared_router():
+        return router.TaskRouter()
+    
     print("="*60)
     print("MULTI-MODEL ORCHESTRATOR TEST SUITE")
     print("="*60)
@@ -229,48 +288,43 @@ def run_tests(verbose: bool = False, live: bool = False):
     
     @runner.test("Router: Backend task categorization")
     def test_router_backend():
-        from router import TaskRouter, TaskCategory
-        router = TaskRouter()
-        decision = router.route("Build a REST API endpoint for user management")
-        assert decision.category == TaskCategory.BACKEND, f"Got {decision.category}"
+        task_router = shared_router()
+        decision = task_router.route("Build a REST API endpoint for user management")
+        assert decision.category == router.TaskCategory.BACKEND, f"Got {decision.category}"
         return True, f"Category: {decision.category.value}, Confidence: {decision.confidence:.0%}"
     
     @runner.test("Router: Frontend task categorization")
     def test_router_frontend():
-        from router import TaskRouter, TaskCategory
-        router = TaskRouter()
-        decision = router.route("Create a React dashboard component with charts")
-        assert decision.category == TaskCategory.FRONTEND, f"Got {decision.category}"
+        task_router = shared_router()
+        decision = task_router.route("Create a React dashboard component with charts")
+        assert decision.category == router.TaskCategory.FRONTEND, f"Got {decision.category}"
         return True, f"Category: {decision.category.value}"
     
     @runner.test("Router: DevOps task categorization")
     def test_router_devops():
-        from router import TaskRouter, TaskCategory
-        router = TaskRouter()
-        decision = router.route("Write a Dockerfile for a Node.js application")
-        assert decision.category == TaskCategory.DEVOPS, f"Got {decision.category}"
+        task_router = shared_router()
+        decision = task_router.route("Write a Dockerfile for a Node.js application")
+        assert decision.category == router.TaskCategory.DEVOPS, f"Got {decision.category}"
         return True, f"Category: {decision.category.value}"
     
     @runner.test("Router: Complexity estimation")
     def test_router_complexity():
-        from router import TaskRouter, Complexity
-        router = TaskRouter()
+        task_router = shared_router()
         
-        simple = router.route("Write a simple helper function")
-        complex = router.route("Build a complete enterprise microservices platform")
+        simple = task_router.route("Write a simple helper function")
+        complex = task_router.route("Build a complete enterprise microservices platform")
         
-        assert simple.complexity.level in [Complexity.TRIVIAL, Complexity.SIMPLE], f"Simple got {simple.complexity.level}"
-        assert complex.complexity.level in [Complexity.COMPLEX, Complexity.LARGE], f"Complex got {complex.complexity.level}"
+        assert simple.complexity.level in [router.Complexity.TRIVIAL, router.Complexity.SIMPLE], f"Simple got {simple.complexity.level}"
+        assert complex.complexity.level in [router.Complexity.COMPLEX, router.Complexity.LARGE], f"Complex got {complex.complexity.level}"
         
         return True, f"Simple: {simple.complexity.level.value}, Complex: {complex.complexity.level.value}"
     
     @runner.test("Router: Language detection")
     def test_router_language():
-        from router import TaskRouter
-        router = TaskRouter()
+        task_router = shared_router()
         
-        py = router.route("Build a FastAPI backend service in Python")
-        ts = router.route("Create a TypeScript React component")
+        py = task_router.route("Build a FastAPI backend service in Python")
+        ts = task_router.route("Create a TypeScript React component")
         
         assert py.language and py.language.language == "python", f"Python got {py.language}"
         assert ts.language and ts.language.language in ["typescript", "react"], f"TS got {ts.language}"
@@ -279,21 +333,22 @@ def run_tests(verbose: bool = False, live: bool = False):
     
     @runner.test("Router: Model routing")
     def test_router_routing():
-        from router import TaskRouter
-        router = TaskRouter()
-        decision = router.route("Build a REST API")
+        task_router = shared_router()
+        decision = task_router.route("Build a REST API")
         
         assert len(decision.primary_models) >= 1, "No primary models"
         assert all(m in ["claude-code", "codex", "gemini", "grok"] for m in decision.primary_models)
         
         return True, f"Primary: {decision.primary_models}, Validators: {decision.validators}"
     
-    test_router_backend()
-    test_router_frontend()
-    test_router_devops()
-    test_router_complexity()
-    test_router_language()
-    test_router_routing()
+    runner.run_batch([
+        test_router_backend,
+        test_router_frontend,
+        test_router_devops,
+        test_router_complexity,
+        test_router_language,
+        test_router_routing,
+    ], jobs)
     
     # -------------------------------------------------------------------------
     # Merger Tests
@@ -302,9 +357,6 @@ def run_tests(verbose: bool = False, live: bool = False):
     
     @runner.test("Merger: Code block extraction")
     def test_merger_blocks():
-        from merger import CodeBlockParser
-        parser = CodeBlockParser()
-        
         output = '''Here's code:
 ```python
 def hello():
@@ -315,7 +367,7 @@ And more:
 console.log("hi");
 ```
 '''
-        blocks = parser.parse(output, "test-model")
+        blocks = block_parser.parse(output, "test-model")
         assert len(blocks) == 2, f"Expected 2 blocks, got {len(blocks)}"
         assert blocks[0].language == "python"
         assert blocks[1].language == "javascript"
@@ -324,9 +376,6 @@ console.log("hi");
     
     @runner.test("Merger: Python component parsing")
     def test_merger_components():
-        from merger import PythonComponentParser, ComponentType
-        parser = PythonComponentParser()
-        
         code = '''
 import os
 from typing import List
@@ -340,7 +389,7 @@ class MyClass:
 def my_function(x: int) -> int:
     return x * 2
 '''
-        components = parser.parse(code, "test")
+        components = component_parser.parse(code, "test")
         
         types = [c.type for c in components]
         assert ComponentType.IMPORT in types, "Missing imports"
@@ -350,15 +399,11 @@ def my_function(x: int) -> int:
         
         return True, f"Found: {[c.type.value for c in components]}"
     
-    @runner.test("Merger: Quality scoring")
-    def test_merger_scoring():
-        from merger import QualityScorer, CodeComponent, ComponentType
-        scorer = QualityScorer()
-        
-        good_code = CodeComponent(
-            type=ComponentType.FUNCTION,
-            name="process_data",
-            code='''
+    # Read-only fixtures, built once rather than inside the test.
+    good_component = CodeComponent(
+        type=ComponentType.FUNCTION,
+        name="process_data",
+        code='''
 def process_data(items: List[str]) -> List[str]:
     """Process and filter data items."""
     try:
@@ -366,18 +411,20 @@ def process_data(items: List[str]) -> List[str]:
     except Exception as e:
         raise ValueError(f"Processing failed: {e}")
 ''',
-            source_model="test"
-        )
-        
-        bad_code = CodeComponent(
-            type=ComponentType.FUNCTION,
-            name="x",
-            code="def x(a,b,c,d,e,f): return a+b",
-            source_model="test"
-        )
-        
-        good_score = scorer.score(good_code)
-        bad_score = scorer.score(bad_code)
+        source_model="test"
+    )
+    
+    bad_component = CodeComponent(
+        type=ComponentType.FUNCTION,
+        name="x",
+        code="def x(a,b,c,d,e,f): return a+b",
+        source_model="test"
+    )
+    
+    @runner.test("Merger: Quality scoring")
+    def test_merger_scoring():
+        good_score = scorer.score(good_component)
+        bad_score = scorer.score(bad_component)
         
         assert good_score.total_score > bad_score.total_score, \
             f"Good ({good_score.total_score}) should beat bad ({bad_score.total_score})"
@@ -386,10 +433,7 @@ def process_data(items: List[str]) -> List[str]:
     
     @runner.test("Merger: Consensus merge")
     def test_merger_consensus():
-        from merger import ConsensusMerger
-        merger = ConsensusMerger()
-        
-        result = merger.merge(SAMPLE_OUTPUTS, task="REST API endpoint")
+        result = consensus.merge(SAMPLE_OUTPUTS, task="REST API endpoint")
         
         assert result.merged_code, "No merged code"
         assert result.validation_passed, f"Validation failed: {result.validation_errors}"
@@ -399,25 +443,24 @@ def process_data(items: List[str]) -> List[str]:
     
     @runner.test("Merger: Syntax validation")
     def test_merger_validation():
-        from merger import SyntaxValidator
-        validator = SyntaxValidator()
-        
         valid_code = "def foo(): return 42"
         invalid_code = "def foo( return 42"
         
-        v1, e1 = validator.validate(valid_code)
-        v2, e2 = validator.validate(invalid_code)
+        v1, e1 = syntax_validator.validate(valid_code)
+        v2, e2 = syntax_validator.validate(invalid_code)
         
         assert v1 == True, f"Valid code failed: {e1}"
         assert v2 == False, "Invalid code should fail"
         
         return True, f"Valid: {v1}, Invalid: {v2} (errors: {e2})"
     
-    test_merger_blocks()
-    test_merger_components()
-    test_merger_scoring()
-    test_merger_consensus()
-    test_merger_validation()
+    runner.run_batch([
+        test_merger_blocks,
+        test_merger_components,
+        test_merger_scoring,
+        test_merger_consensus,
+        test_merger_validation,
+    ], jobs)
     
     # -------------------------------------------------------------------------
     # Validator Tests
@@ -426,8 +469,6 @@ def process_data(items: List[str]) -> List[str]:
     
     @runner.test("Validator: Selection logic")
     def test_validator_selection():
-        from validator import select_validator
-        
         # Claude + Codex should get Gemini
         v1 = select_validator(["claude-code", "codex"])
         assert v1 == "gemini", f"Expected gemini, got {v1}"
@@ -440,8 +481,6 @@ def process_data(items: List[str]) -> List[str]:
     
     @runner.test("Validator: Escalation triggers")
     def test_validator_escalation():
-        from validator import ValidationResult, ValidationStatus, OutputAnalysis, should_escalate
-        
         # Low confidence should escalate
         low_conf = ValidationResult(
             task="test",
@@ -463,8 +502,213 @@ def process_data(items: List[str]) -> List[str]:
         
         return True, f"Escalation reasons: {reasons}"
     
-    test_validator_selection()
-    test_validator_escalation()
+    # Validator response used by the stub runners below
+    stub_response = json.dumps({
+        "analyses": {
+            "claude-code": {"score": 85, "merge_worthy": True},
+            "codex": {"score": 70, "merge_worthy": True, "issues": ["No input validation"]},
+        },
+        "merge_recommendation": ["claude-code"],
+        "confidence": 0.9,
+        "concerns": [],
+        "summary": "claude-code is the stronger base",
+    })
+    stub_outputs = {"claude-code": "def a(): pass", "codex": "def b(): pass"}
+    
+    @runner.test("Validator: Response cache modes")
+    def test_validator_cache_modes():
+        calls = []
+        
+        def counting_runner(model, prompt):
+            calls.append(model)
+            return stub_response
+        
+        with tempfile.TemporaryDirectory() as tmp:
+            path = f"{tmp}/cache.sqlite"
+            
+            # disabled: every call reaches the model, nothing is stored
+            with Validator(counting_runner, cache_mode="disabled", cache_path=path) as v:
+                v.validate("task", stub_outputs)
+                v.validate("task", stub_outputs)
+                assert v.cache is None
+            assert len(calls) == 2, f"disabled: {len(calls)} model calls"
+            
+            # enabled: a repeated request is served from the cache
+            calls.clear()
+            with Validator(counting_runner, cache_mode="enabled", cache_path=path) as v:
+                first = v.validate("task", stub_outputs)
+                second = v.validate("task", stub_outputs)
+            assert len(calls) == 1, f"enabled: {len(calls)} model calls"
+            assert first.confidence == second.confidence
+            
+            # read-only: hits are served, misses call the model but are not stored
+            calls.clear()
+            with Validator(counting_runner, cache_mode="read-only", cache_path=path) as v:
+                v.validate("task", stub_outputs)
+                v.validate("other task", stub_outputs)
+                v.validate("other task", stub_outputs)
+            assert len(calls) == 2, f"read-only: {len(calls)} model calls"
+            with ValidationCache(path) as cache:
+                rows = cache._conn.execute("SELECT COUNT(*) FROM cache").fetchone()[0]
+            assert rows == 1, f"read-only wrote to the cache ({rows} rows)"
+            
+            # replay: hits are served, a miss raises instead of calling the model
+            calls.clear()
+            with Validator(counting_runner, cache_mode="replay", cache_path=path) as v:
+                v.validate("task", stub_outputs)
+                try:
+                    v.validate("other task", stub_outputs)
+                except LookupError:
+                    pass
+                else:
+                    raise AssertionError("replay miss did not raise LookupError")
+            assert not calls, f"replay: {len(calls)} model calls"
+        
+        return True, "disabled, enabled, read-only and replay behave as documented"
+    
+    @runner.test("Validator: Failed responses are not cached")
+    def test_validator_cache_failures():
+        replies = ["", "Sorry, the model timed out", "```json\n{not json\n```", stub_response]
+        calls = []
+        
+        def flaky_runner(model, prompt):
+            calls.append(model)
+            return replies[len(calls) - 1]
+        
+        with tempfile.TemporaryDirectory() as tmp:
+            with Validator(flaky_runner, cache_mode="enabled", cache_path=f"{tmp}/cache.sqlite") as v:
+                # Empty, JSON-free and malformed replies each reach the model again
+                for _ in replies:
+                    v.validate("task", stub_outputs)
+                assert len(calls) == 4, f"{len(calls)} model calls for 4 validations"
+                
+                # The first reply that parsed is stored and served from then on
+                result = v.validate("task", stub_outputs)
+                assert len(calls) == 4, "Parsed response was not cached"
+                assert result.confidence == 0.9
+        
+        return True, "empty, plain-text and malformed replies skipped the cache"
+    
+    @runner.test("Validator: Concurrent validate_many")
+    def test_validator_many():
+        lock = threading.Lock()
+        in_flight = [0, 0]  # current, peak
+        calls = []
+        
+        def slow_runner(model, prompt):
+            with lock:
+                in_flight[0] += 1
+                in_flight[1] = max(in_flight[1], in_flight[0])
+                calls.append(model)
+            try:
+                # Later jobs finish first, so order comes from validate_many
+                job = int(prompt.split("job ", 1)[1].split()[0])
+                time.sleep(0.01 * (8 - job))
+                if job == 5:
+                    raise RuntimeError("model down")
+                return stub_response
+            finally:
+                with lock:
+                    in_flight[0] -= 1
+        
+        jobs = [(f"job {i} task", stub_outputs) for i in range(8)]
+        with tempfile.TemporaryDirectory() as tmp:
+            with Validator(slow_runner, cache_mode="enabled", cache_path=f"{tmp}/cache.sqlite") as v:
+                results = asyncio.run(v.validate_many(jobs, max_concurrency=3, return_exceptions=True))
+                
+                assert [r.task if isinstance(r, ValidationResult) else None for r in results] == \
+                    [f"job {i} task" if i != 5 else None for i in range(8)], "Results out of job order"
+                assert isinstance(results[5], RuntimeError), f"Job 5 gave {results[5]!r}"
+                assert in_flight[1] <= 3, f"{in_flight[1]} validations in flight with max_concurrency=3"
+                
+                # By default the first failure propagates
+                try:
+                    asyncio.run(v.validate_many(jobs[5:6]))
+                except RuntimeError:
+                    pass
+                else:
+                    raise AssertionError("validate_many swallowed an exception")
+                
+                # Every successful job was written through the shared connection
+                rows = v.cache._conn.execute("SELECT COUNT(*) FROM cache").fetchone()[0]
+                assert rows == 7, f"Expected 7 cached responses, got {rows}"
+                calls.clear()
+                asyncio.run(v.validate_many(jobs[:5] + jobs[6:], max_concurrency=3))
+                assert not calls, f"{len(calls)} cache misses after concurrent writes"
+        
+        return True, f"8 jobs in order, peak concurrency {in_flight[1]}"
+    
+    @runner.test("Validator: Rate limit pacing")
+    def test_validator_token_bucket():
+        # A fake clock that only moves when the bucket sleeps
+        now = [0.0]
+        sleeps = []
+        
+        def fake_sleep(seconds):
+            sleeps.append(seconds)
+            now[0] += seconds
+        
+        bucket = TokenBucket(rpm=60, tpm=600, clock=lambda: now[0], sleep=fake_sleep)
+        
+        # A full bucket allows a burst of rpm requests without waiting
+        for _ in range(60):
+            bucket.acquire(5)
+        assert not sleeps, f"Burst within limits slept {sleeps}"
+        
+        # The next request waits for one request to refill: 60 rpm is 1 per second
+        bucket.acquire(5)
+        assert abs(now[0] - 1.0) < 1e-9, f"Waited {now[0]}s for a request slot, expected 1s"
+        
+        # Token budget: 600 tpm refills 10 per second. 305 tokens used and
+        # 10 refilled leave 305, so 400 more waits 9.5s for the missing 95
+        sleeps.clear()
+        bucket.acquire(400)
+        assert abs(sum(sleeps) - 9.5) < 1e-9, f"Waited {sum(sleeps)}s for tokens, expected 9.5s"
+        
+        # An oversized request is capped at a full bucket rather than blocking forever
+        sleeps.clear()
+        bucket.acquire(10_000)
+        assert abs(sum(sleeps) - 60.0) < 1e-9, f"Waited {sum(sleeps)}s for a full bucket, expected 60s"
+        
+        # Under one request per minute the bucket still holds a whole request
+        sleeps.clear()
+        slow = TokenBucket(rpm=0.5, clock=lambda: now[0], sleep=fake_sleep)
+        slow.acquire()
+        slow.acquire()
+        assert sleeps == [120.0], f"rpm=0.5 slept {sleeps[:5]}, expected [120.0]"
+        
+        return True, "burst of 60, then paced; rpm=0.5 waits 120s per request"
+    
+    @runner.test("Validator: Streaming model runner")
+    def test_validator_streaming():
+        fenced = f"Here is my review:\n```json\n{stub_response}\n```\n"
+        
+        def streaming_runner(model, prompt):
+            # Chunk boundaries fall inside keys, strings and the fence itself
+            for i in range(0, len(fenced), 7):
+                yield fenced[i:i + 7]
+        
+        streamed = Validator(streaming_runner).validate("task", stub_outputs)
+        whole = Validator(lambda model, prompt: fenced).validate("task", stub_outputs)
+        
+        assert streamed.raw_validation == fenced, "Chunks were not joined in order"
+        for field_name in ("status", "confidence", "merge_recommendation", "concerns",
+                           "needs_human_review", "review_reasons", "summary"):
+            got, expected = getattr(streamed, field_name), getattr(whole, field_name)
+            assert got == expected, f"{field_name}: streamed {got!r} != {expected!r}"
+        assert streamed.analyses == whole.analyses, "Analyses differ"
+        
+        return True, f"{-(-len(fenced) // 7)} chunks parsed like one response"
+    
+    runner.run_batch([
+        test_validator_selection,
+        test_validator_escalation,
+        test_validator_cache_modes,
+        test_validator_cache_failures,
+        test_validator_many,
+        test_validator_token_bucket,
+        test_validator_streaming,
+    ], jobs)
     
     # -------------------------------------------------------------------------
     # Orchestrator Integration Tests
@@ -473,8 +717,6 @@ def process_data(items: List[str]) -> List[str]:
     
     @runner.test("Orchestrator: Task analysis")
     def test_orch_analysis():
-        from orchestrator import analyze_task, ExecutionMode
-        
         cat, mode = analyze_task("Build a simple REST API endpoint")
         
         assert cat in ["backend", "generic"], f"Unexpected category: {cat}"
@@ -484,8 +726,6 @@ def process_data(items: List[str]) -> List[str]:
     
     @runner.test("Orchestrator: Routing integration")
     def test_orch_routing():
-        from orchestrator import get_routing, ExecutionMode
-        
         primaries, validators = get_routing("backend", ExecutionMode.MEDIUM, "Build a REST API")
         
         assert len(primaries) >= 1, "No primary models"
@@ -493,13 +733,10 @@ def process_data(items: List[str]) -> List[str]:
         
         return True, f"Primary: {primaries}, Validators: {validators}"
     
-    @runner.test("Orchestrator: Scoring function")
-    def test_orch_scoring():
-        from orchestrator import score_output, ModelOutput
-        
-        good = ModelOutput(
-            model="test",
-            code='''
+    # Read-only fixtures, built once rather than inside the tests.
+    good_output = ModelOutput(
+        model="test",
+        code='''
 def process(data: List[str]) -> List[str]:
     """Process data items."""
     try:
@@ -507,21 +744,44 @@ def process(data: List[str]) -> List[str]:
     except Exception as e:
         raise ValueError(str(e))
 ''',
-            explanation="test",
+        explanation="test",
+        execution_time=1.0,
+        success=True
+    )
+    
+    bad_output = ModelOutput(
+        model="test",
+        code="x=1",
+        explanation="test",
+        execution_time=1.0,
+        success=True
+    )
+    
+    sample_model_outputs = [
+        ModelOutput(
+            model="claude-code",
+            code=SAMPLE_OUTPUTS["claude-code"],
+            raw_output=SAMPLE_OUTPUTS["claude-code"],
+            explanation="",
             execution_time=1.0,
-            success=True
-        )
-        
-        bad = ModelOutput(
-            model="test",
-            code="x=1",
-            explanation="test",
+            success=True,
+            score=85
+        ),
+        ModelOutput(
+            model="codex",
+            code=SAMPLE_OUTPUTS["codex"],
+            raw_output=SAMPLE_OUTPUTS["codex"],
+            explanation="",
             execution_time=1.0,
-            success=True
+            success=True,
+            score=75
         )
-        
-        good_score = score_output(good, "test task")
-        bad_score = score_output(bad, "test task")
+    ]
+    
+    @runner.test("Orchestrator: Scoring function")
+    def test_orch_scoring():
+        good_score = score_output(good_output, "test task")
+        bad_score = score_output(bad_output, "test task")
         
         assert good_score > bad_score, f"Good ({good_score}) should beat bad ({bad_score})"
         
@@ -529,56 +789,111 @@ def process(data: List[str]) -> List[str]:
     
     @runner.test("Orchestrator: Merge with sample outputs")
     def test_orch_merge():
-        from orchestrator import merge_outputs, ModelOutput
-        
-        outputs = [
-            ModelOutput(
-                model="claude-code",
-                code=SAMPLE_OUTPUTS["claude-code"],
-                raw_output=SAMPLE_OUTPUTS["claude-code"],
-                explanation="",
-                execution_time=1.0,
-                success=True,
-                score=85
-            ),
-            ModelOutput(
-                model="codex",
-                code=SAMPLE_OUTPUTS["codex"],
-                raw_output=SAMPLE_OUTPUTS["codex"],
-                explanation="",
-                execution_time=1.0,
-                success=True,
-                score=75
-            )
-        ]
-        
-        merged_code, explanation = merge_outputs(outputs, "REST API")
+        merged_code, explanation = merge_outputs(sample_model_outputs, "REST API")
         
         assert merged_code, "No merged code"
         assert "def" in merged_code or "class" in merged_code, "No code structure"
         
         return True, f"Merged {len(merged_code)} chars: {explanation[:50]}..."
     
-    test_orch_analysis()
-    test_orch_routing()
-    test_orch_scoring()
-    test_orch_merge()
+    @runner.test("Orchestrator: Batched progress delivery")
+    def test_orch_progress_batching():
+        class RecordingProgress(OpenClawProgress):
+            def __init__(self):
+                super().__init__(throttle_ms=0)
+                self.sent = []
+            
+            async def _send_message(self, message):
+                self.sent.append(message)
+        
+        handler = RecordingProgress()
+        
+        async def emit_all(count):
+            for i in range(count):
+                await handler.emit(task_received(f"event {i}"))
+            await asyncio.wait_for(handler.flush(), timeout=2)
+        
+        # Events emitted back to back arrive in fewer messages than events
+        asyncio.run(emit_all(5))
+        lines = [line for m in handler.sent for line in m.split("\n")]
+        assert len(lines) == 5, f"Expected 5 events, got {len(lines)}"
+        assert len(handler.sent) < 5, f"Events were not batched: {handler.sent}"
+        assert handler._consumer is None, "Consumer left running after flush"
+        
+        # A second event loop with the same handler must not hang
+        first_run = len(handler.sent)
+        asyncio.run(emit_all(3))
+        assert len(handler.sent) > first_run, "Second run delivered nothing"
+        
+        # Send failures surface from flush() instead of being printed
+        async def failing_send(message):
+            raise ConnectionError("channel down")
+        handler._send_message = failing_send
+        try:
+            asyncio.run(emit_all(1))
+        except ConnectionError:
+            pass
+        else:
+            raise AssertionError("flush() swallowed a send error")
+        
+        return True, f"{len(lines)} events in {first_run} message(s)"
+    
+    @runner.test("Orchestrator: run_with_updates keeps run() errors")
+    def test_orch_updates_errors():
+        class FailingOrchestrator(Orchestrator):
+            async def run(self, task, on_progress=None, **kwargs):
+                await on_progress(task_received(task))
+                raise ValueError("run failed")
+        
+        class BrokenChannel(OpenClawProgress):
+            async def _send_message(self, message):
+                raise ConnectionError("channel down")
+        
+        class EmitOnly:
+            async def emit(self, progress):
+                pass
+        
+        # Neither a failing flush nor a handler without flush() may mask run()'s error
+        for handler in (BrokenChannel(throttle_ms=0), EmitOnly()):
+            try:
+                asyncio.run(FailingOrchestrator().run_with_updates("task", handler))
+            except ValueError:
+                pass
+            else:
+                raise AssertionError(f"{type(handler).__name__}: run() error was lost")
+        
+        return True, "run() error propagates past flush failures and flush-less handlers"
+    
+    runner.run_batch([
+        test_orch_analysis,
+        test_orch_routing,
+        test_orch_scoring,
+        test_orch_merge,
+        test_orch_progress_batching,
+        test_orch_updates_errors,
+    ], jobs)
     
     # -------------------------------------------------------------------------
     # Live Grok API Test (optional)
     # -------------------------------------------------------------------------
     if live:
         print("\n🌐 Live API Tests")
+        api_key = os.getenv("GROK_API_KEY")
+        
+        # One client for every live test, so its requests session keeps the
+        # HTTPS connection open between calls. Imported and built inside the
+        # first test to run, so a missing `requests` is reported as a failure.
+        @lru_cache(maxsize=None)
+        def shared_grok():
+            from grok_client import GrokClient
+            return GrokClient(api_key=api_key)
         
         @runner.test("Grok API: Connection")
         def test_grok_connection():
-            api_key = os.getenv("GROK_API_KEY")
             if not api_key:
                 return False, "GROK_API_KEY not set"
             
-            from grok_client import GrokClient
-            client = GrokClient(api_key=api_key)
-            response = client.chat("Say 'test successful' in exactly those words.")
+            response = shared_grok().chat("Say 'test successful' in exactly those words.")
             
             assert response.content, "No response"
             assert response.total_tokens > 0, "No tokens used"
@@ -587,13 +902,10 @@ def process(data: List[str]) -> List[str]:
         
         @runner.test("Grok API: Code generation")
         def test_grok_code():
-            api_key = os.getenv("GROK_API_KEY")
             if not api_key:
                 return False, "GROK_API_KEY not set"
             
-            from grok_client import GrokClient
-            client = GrokClient(api_key=api_key)
-            response = client.code_task("Write a Python function to check if a number is prime")
+            response = shared_grok().code_task("Write a Python function to check if a number is prime")
             
             assert response.content, "No response"
             code = response.first_code_block or response.content
@@ -601,6 +913,7 @@ def process(data: List[str]) -> List[str]:
             
             return True, f"Generated {len(code)} chars of code"
         
+        # Live calls stay serial so the endpoint isn't hit concurrently.
         test_grok_connection()
         test_grok_code()
     
@@ -611,8 +924,6 @@ def process(data: List[str]) -> List[str]:
     
     @runner.test("Benchmark: Task suite loaded")
     def test_benchmark_tasks():
-        from benchmark import BENCHMARK_TASKS
-        
         assert len(BENCHMARK_TASKS) > 0, "No benchmark tasks"
         
         categories = set(t.category.value for t in BENCHMARK_TASKS)
@@ -622,15 +933,14 @@ def process(data: List[str]) -> List[str]:
     
     @runner.test("Benchmark: Scoring criteria")
     def test_benchmark_scoring():
-        from benchmark import SCORING_CRITERIA
-        
-        total_weight = sum(c["weight"] for c in SCORING_CRITERIA.values())
-        assert total_weight == 100, f"Weights sum to {total_weight}, expected 100"
+        assert TOTAL_WEIGHT == 100, f"Weights sum to {TOTAL_WEIGHT}, expected 100"
         
-        return True, f"6 criteria, {total_weight} total points"
+        return True, f"6 criteria, {TOTAL_WEIGHT} total points"
     
-    test_benchmark_tasks()
-    test_benchmark_scoring()
+    runner.run_batch([
+        test_benchmark_tasks,
+        test_benchmark_scoring,
+    ], jobs)
     
     # -------------------------------------------------------------------------
     # Summary
@@ -648,8 +958,9 @@ if __name__ == "__main__":
     parser = argparse.ArgumentParser(description="Orchestrator Test Suite")
     parser.add_argument("--verbose", "-v", action="store_true", help="Verbose output")
     parser.add_argument("--live", "-l", action="store_true", help="Include live API tests")
+    parser.add_argument("--jobs", "-j", type=int, default=1, help="Threads per offline test section")
     
     args = parser.parse_args()
     
-    success = run_tests(verbose=args.verbose, live=args.live)
+    success = run_tests(verbose=args.verbose, live=args.live, jobs=args.jobs)
     sys.exit(0 if success else 1)